@@ -25,6 +25,8 @@ EVENT_MESSAGE_POSTED = "message_posted"
 # ========================================
 # イベント型定義
 # ========================================
+# イベントは送信ごとに生成される使い捨ての値オブジェクト。
+# slots=True で __dict__ を持たせず、生成コストとメモリを抑える。
 
 
 class MessageLevel(str, Enum):
@@ -36,7 +38,7 @@ class MessageLevel(str, Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioRecordedEvent:
     """
     音声録音完了イベント
@@ -49,7 +51,7 @@ class AudioRecordedEvent:
     end_time: datetime  # 録音終了時刻
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SegmentTranscribedEvent:
     """
     文字起こし完了イベント
@@ -60,7 +62,7 @@ class SegmentTranscribedEvent:
     segment: TranscriptionSegment  # 文字起こしされた音声セグメント
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SummaryGeneratedEvent:
     """
     要約生成イベント
@@ -72,7 +74,7 @@ class SummaryGeneratedEvent:
     is_final: bool = False  # 終了時サマリか否か（デフォルト: False = 中間サマリ）
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessagePostedEvent:
     """
     メッセージ投稿イベント
@@ -4,8 +4,10 @@ Stream Scribe - Settings Schema
 設定のスキーマ定義（Pydanticモデル）
 """
 
+import warnings
 from enum import StrEnum
 from pathlib import Path
+from typing import Any, Literal
 
 from pydantic import Field, computed_field, model_validator
 from pydantic_settings import BaseSettings
@@ -20,6 +22,28 @@ _WHISPER_INITIAL_PROMPT = "句読点を含む正確な日本語で書き起こ
 # ========================================
 # Helper Functions
 # ========================================
+def _pop_deprecated_setting(data: Any, key: str, message: str) -> tuple[Any, Any]:
+    """
+    廃止された設定キーを検証前の入力から取り除き、指定されていれば警告する
+
+    既存の設定ファイルが ValidationError（未知のキー）で起動不能にならないよう、
+    廃止したキーは警告付きで受け付ける。
+
+    Args:
+        data: 検証前の入力（dict以外はそのまま返す）
+        key: 廃止された設定キー
+        message: 警告メッセージ
+
+    Returns:
+        tuple[Any, Any]: (キーを除いた入力, 指定されていた値（未指定ならNone）)
+    """
+    if not isinstance(data, dict) or key not in data:
+        return data, None
+    warnings.warn(message, FutureWarning, stacklevel=2)
+    data = dict(data)
+    return data, data.pop(key)
+
+
 def _default_whisper_params() -> list["WhisperParamsSettings"]:
     """Whisper再試行パラメータのデフォルト値を生成"""
     return [
@@ -104,15 +128,37 @@ class CoreSettings(BaseSettings):
 class AudioSettings(BaseSettings):
     """Audio入力設定"""
 
-    block_sec: float = Field(
-        default=0.1,
-        description="sounddeviceのブロックサイズ（秒）",
+    block_chunks: int = Field(
+        default=2,
+        description="sounddeviceのブロックサイズ（chunk_sizeの倍数、2=1024サンプル） - 2のべき乗推奨（一部のALSA環境では2のべき乗以外で性能低下）",
+    )
+    latency: Literal["low", "high"] | float = Field(
+        default="low",
+        description="sounddeviceの入力レイテンシ（'low'/'high' または秒数）",
     )
     queue_get_timeout_sec: float = Field(
         default=0.5,
         description="キュー取得タイムアウト（秒）",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def migrate_block_sec(cls, data: Any) -> Any:
+        """廃止された block_sec（秒）を block_chunks（チャンク数）に読み替える"""
+        data, block_sec = _pop_deprecated_setting(
+            data,
+            "block_sec",
+            "audio.block_sec is deprecated; use audio.block_chunks "
+            "(block size as a multiple of the VAD chunk size) instead",
+        )
+        if block_sec is not None and "block_chunks" not in data:
+            # サンプルレート・チャンク長はWhisper/VADで固定のため、既定値で換算する
+            core = CoreSettings()
+            data["block_chunks"] = max(
+                1, round(float(block_sec) * core.sample_rate / core.chunk_size)
+            )
+        return data
+
 
 # ========================================
 # VAD Configuration
@@ -124,6 +170,10 @@ class VADModelSettings(BaseSettings):
         default="https://github.com/snakers4/silero-vad/raw/v5.0/files/silero_vad.onnx",
         description="モデルダウンロードURL",
     )
+    sha256: str | None = Field(
+        default=None,
+        description="モデルファイルのSHA-256（指定時は既存ファイルを検証し、不一致なら再ダウンロード）",
+    )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -169,6 +219,10 @@ class VADDetectionSettings(BaseSettings):
         default=2.0,
         description="AudioStreamスレッド停止タイムアウト（秒）",
     )
+    file_batch_chunks: int = Field(
+        default=32,
+        description="ファイル入力時にまとめてVAD推論するチャンク数（32ms*32=約1秒）",
+    )
 
     def preroll_chunks(self, chunk_ms: int) -> int:
         """プリロールバッファのチャンク数を計算"""
@@ -218,6 +272,14 @@ class WhisperSettings(BaseSettings):
         default=10.0,
         description="書き起こしスレッド停止タイムアウト（秒）",
     )
+    max_queued_chunks: int = Field(
+        default=8,
+        description="リアルタイム入力時の文字起こし待ち音声の上限 - 超えると最も古い音声を破棄（0で無制限、ファイル入力では常に無制限）",
+    )
+    silence_peak_threshold: float = Field(
+        default=1e-3,
+        description="無音判定のピーク振幅閾値 - 最大振幅がこれ未満の音声はWhisperを呼ばずに破棄（0で無効）",
+    )
     params: list[WhisperParamsSettings] = Field(
         default_factory=_default_whisper_params,
         description="再試行パラメータリスト - 5段階の戦略的再試行（標準→ループ対策+軽探索→バイアス排除+中探索→厳格化+高探索→最終ゲート+最大探索）",
@@ -484,14 +546,6 @@ class AppSettings(BaseSettings):
         default=0.1,
         description="ステータス更新間隔（秒）",
     )
-    input_poll_interval_sec: float = Field(
-        default=0.1,
-        description="入力ポーリング間隔（秒）",
-    )
-    transcription_progress_poll_interval_sec: float = Field(
-        default=0.5,
-        description="文字起こし進捗ポーリング間隔（秒）",
-    )
     max_error_detail_length: int = Field(
         default=200,
         description="エラー詳細の最大表示文字数",
@@ -501,6 +555,24 @@ class AppSettings(BaseSettings):
         description="トレースバックの最大表示文字数",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def drop_removed_poll_intervals(cls, data: Any) -> Any:
+        """イベント駆動化で不要になったポーリング間隔の設定を警告付きで無視する"""
+        data, _ = _pop_deprecated_setting(
+            data,
+            "input_poll_interval_sec",
+            "app.input_poll_interval_sec is deprecated and ignored; "
+            "input is now waited on without polling",
+        )
+        data, _ = _pop_deprecated_setting(
+            data,
+            "transcription_progress_poll_interval_sec",
+            "app.transcription_progress_poll_interval_sec is deprecated and ignored; "
+            "shutdown progress is reported as each segment completes",
+        )
+        return data
+
 
 # ========================================
 # Main Settings Class
@@ -8,12 +8,11 @@ import re
 from abc import ABC, abstractmethod
 from typing import Any
 
-from anthropic import Anthropic
-from anthropic.types import TextBlock
-from openai import OpenAI
-
 from stream_scribe.domain import LLMBackend, SummarySettings
 
+# 各プロバイダのSDK（anthropic / openai）は読み込みが重いため、
+# 使用するバックエンドのクライアント生成時にのみ読み込む
+
 
 class LLMClient(ABC):
     """
@@ -80,6 +79,8 @@ class ClaudeClient(LLMClient):
             settings: サマリー設定（APIキー、モデル名、最大トークン数など）
         """
 
+        from anthropic import Anthropic
+
         # 設定検証済みのため、anthropic_api_keyは必ず存在する
         assert settings.anthropic_api_key is not None
         self.settings = settings
@@ -124,6 +125,8 @@ class ClaudeClient(LLMClient):
         if top_p is not None:
             kwargs["top_p"] = top_p
 
+        from anthropic.types import TextBlock
+
         message = self.client.messages.create(**kwargs)
 
         # TextBlockの場合のみtextを取得
@@ -163,6 +166,8 @@ class VLLMClient(LLMClient):
         Args:
             settings: サマリー設定（vLLMサーバURL、モデル名、APIキーなど）
         """
+        from openai import OpenAI
+
         self.settings = settings
         self.client = OpenAI(
             base_url=settings.vllm_base_url,
@@ -60,6 +60,7 @@ class RealtimeSummarizer(threading.Thread):
         # セグメント履歴の保持（要約済み + 未要約）
         self.summarized_segments: list[TranscriptionSegment] = []
         self.pending_segments: list[TranscriptionSegment] = []
+        self._pending_char_count = 0  # 未要約セグメントの合計文字数
         self._segment_lock = threading.Lock()  # セグメント操作の排他制御
 
         # 処理トリガー用イベント
@@ -75,6 +76,7 @@ class RealtimeSummarizer(threading.Thread):
         if self.running:
             with self._segment_lock:
                 self.pending_segments.append(segment)
+                self._pending_char_count += len(segment.text)
                 self.last_segment_time = time.monotonic()
 
             # 処理トリガーイベントをセット
@@ -82,9 +84,13 @@ class RealtimeSummarizer(threading.Thread):
 
     @property
     def buffer_char_count(self) -> int:
-        """未処理セグメントの文字数を取得"""
-        with self._segment_lock:
-            return sum(len(seg.text) for seg in self.pending_segments)
+        """
+        未処理セグメントの文字数を取得
+
+        追加・クリア時に更新する合計値を返す（ステータス表示から周期的に
+        呼ばれるため、セグメントを走査せずロックも取らない）
+        """
+        return self._pending_char_count
 
     def _should_summarize(self) -> bool:
         """
@@ -120,6 +126,7 @@ class RealtimeSummarizer(threading.Thread):
 
             new_segments = self.pending_segments.copy()
             self.pending_segments.clear()
+            self._pending_char_count = 0
 
         # プロンプト戦略を使用してプロンプトを構築
         # 要約済みセグメントから直近N件を取得
@@ -193,6 +200,7 @@ class RealtimeSummarizer(threading.Thread):
         # 未処理セグメントをクリア（現在の処理を破棄）
         with self._segment_lock:
             self.pending_segments.clear()
+            self._pending_char_count = 0
 
         # イベントをセットして待機中のスレッドを起こす
         self._trigger_event.set()
@@ -4,15 +4,40 @@ Stream Scribe - Audio Infrastructure
 オーディオ関連のインフラストラクチャ層
 """
 
-# 音声ソース
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# 音声ソース（--list-devices でも読み込むため、重い依存は使用時に読み込む実装を保つ
+# 例: scipy はファイル入力のリサンプラ生成時にのみ読み込む）
 from .sources import AudioSource, FileAudioSource, MicrophoneAudioSource
 
 # VADコンポーネント
-from .vad_detector import VADDetector
 from .vad_state_machine import VadStateMachine
 
-# 音声ストリーム
-from .audio_stream import AudioStream
+if TYPE_CHECKING:
+    from .audio_stream import AudioStream, AudioStreamStatus
+    from .vad_detector import VADDetector
+
+# ONNX Runtime を読み込むVAD・音声ストリームは初回参照時に読み込む
+# （--list-devices は音声ソースのみ使うため）
+_LAZY_EXPORTS = {
+    # VAD
+    "VADDetector": ".vad_detector",
+    # 音声ストリーム
+    "AudioStream": ".audio_stream",
+    "AudioStreamStatus": ".audio_stream",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """遅延読み込み対象の公開名を解決する（PEP 562）"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # 音声ソース
@@ -24,4 +49,5 @@ __all__ = [
     "VadStateMachine",
     # 音声ストリーム
     "AudioStream",
+    "AudioStreamStatus",
 ]
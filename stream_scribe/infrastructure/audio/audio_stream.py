@@ -24,9 +24,9 @@ from .vad_detector import VADDetector
 from .vad_state_machine import VadAction, VadStateMachine
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioStreamStatus:
-    """音声ストリームの状態"""
+    """音声ストリームの状態（ステータス表示が周期的に生成するため __dict__ を持たない）"""
 
     probability: float  # VAD確率
     is_recording: bool  # 録音中かどうか
@@ -102,28 +102,84 @@ class AudioStream:
         """チャンク単位のVAD処理"""
         # VAD推論
         probability = self.vad(chunk)
-
+        self._apply_vad_result(chunk, probability)
+
+    def process_batch(self, chunks: list[np.ndarray]) -> None:
+        """
+        複数チャンクをまとめてVAD処理（非リアルタイム入力向け）
+
+        VAD推論とステートマシンの状態遷移をそれぞれまとめて実行する。
+        途中でVADの状態がリセットされた場合、以降の確率はリセット前の
+        状態で計算されているため、残りのチャンクを再推論する。
+        """
+        start = 0
+        while start < len(chunks):
+            pending = chunks[start:]
+            probabilities = self.vad.process_batch(np.stack(pending))
+
+            is_recording = self.state_machine.is_recording
+            actions = self.state_machine.process_batch(probabilities.tolist())
+
+            for chunk, action in zip(pending, actions, strict=False):
+                # リセットを伴うアクションは必ず末尾なので、戻り値は見なくてよい
+                if action == VadAction.START_RECORDING:
+                    is_recording = True
+                elif action == VadAction.STOP_RECORDING:
+                    is_recording = False
+                self._apply_action(chunk, action, is_recording)
+
+            self._current_probability = float(probabilities[len(actions) - 1])
+            start += len(actions)
+
+    def _apply_vad_result(self, chunk: np.ndarray, probability: float) -> bool:
+        """
+        VAD確率に基づいて状態遷移と録音バッファを更新
+
+        Returns:
+            bool: VADの内部状態がリセットされた場合True
+        """
         # 現在の確率を保存
         self._current_probability = probability
 
-        # プリロールバッファに追加
-        self.preroll_ring_buffer.append(chunk)
-
         # ステートマシンで状態遷移を処理
         action = self.state_machine.process(probability)
+        return self._apply_action(chunk, action, self.state_machine.is_recording)
+
+    def _apply_action(
+        self, chunk: np.ndarray, action: VadAction, is_recording: bool
+    ) -> bool:
+        """
+        状態遷移のアクションを実行し、プリロール・録音バッファを更新
+
+        Args:
+            chunk: 処理対象のチャンク
+            action: ステートマシンが返したアクション
+            is_recording: 状態遷移後に録音中かどうか
+
+        Returns:
+            bool: VADの内部状態がリセットされた場合True
+        """
+        # プリロールバッファに追加
+        self.preroll_ring_buffer.append(chunk)
 
-        # アクションに応じた処理
-        if action == VadAction.START_RECORDING:
-            self._start_recording()
-        elif action == VadAction.STOP_RECORDING:
-            self._stop_recording()
-        elif action == VadAction.RESET_VAD_MODEL:
-            self.vad.reset_states()
+        # アクションに応じた処理（大半のチャンクは NONE=0 なので分岐を素通りする）
+        vad_reset = False
+        if action:
+            if action == VadAction.START_RECORDING:
+                self._start_recording()
+            elif action == VadAction.STOP_RECORDING:
+                self._stop_recording()
+                vad_reset = True
+            elif action == VadAction.RESET_VAD_MODEL:
+                self.vad.reset_states()
+                vad_reset = True
 
         # 録音中ならデータをバッファへ
-        if self.state_machine.is_recording:
+        if is_recording:
             self.recording_buffer.append(chunk)
 
+        return vad_reset
+
     def _start_recording(self) -> None:
         """録音開始（プリロールを結合）"""
         self.recording_start = datetime.now()
@@ -155,16 +211,35 @@ class AudioStream:
 
     def _audio_processing_loop(self) -> None:
         """音声処理ループ（別スレッドで実行）"""
-        for chunk in self.audio_source.stream():
-            if self._running:
-                self.process_chunk(chunk)
-            else:
-                break
+        if self.audio_source.is_realtime:
+            for chunk in self.audio_source.stream():
+                if self._running:
+                    self.process_chunk(chunk)
+                else:
+                    break
+        else:
+            self._batch_processing_loop()
 
         # ストリーム終了時に録音中の場合は停止
         if self.state_machine.is_recording:
             self._stop_recording()
 
+    def _batch_processing_loop(self) -> None:
+        """非リアルタイム入力の処理ループ（VAD推論をまとめて実行）"""
+        batch_size = self.vad_detection_settings.file_batch_chunks
+        batch: list[np.ndarray] = []
+        for chunk in self.audio_source.stream():
+            if not self._running:
+                return
+
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                self.process_batch(batch)
+                batch = []
+
+        if batch and self._running:
+            self.process_batch(batch)
+
     def start(self) -> None:
         """音声ストリーム開始"""
         if self._thread and self._thread.is_alive():
@@ -206,6 +281,16 @@ class AudioStream:
         # AudioSourceをクリーンアップ
         self.audio_source.stop()
 
+    def join(self, timeout: float | None = None) -> None:
+        """
+        音声処理スレッドの終了を待機
+
+        Args:
+            timeout: 最大待機時間（秒）、Noneなら終了まで待つ
+        """
+        if self._thread:
+            self._thread.join(timeout)
+
     def is_alive(self) -> bool:
         """音声処理スレッドが実行中かどうかを返す"""
         return self._thread.is_alive() if self._thread else False
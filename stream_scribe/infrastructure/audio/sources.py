@@ -6,6 +6,8 @@ Stream Scribe - Audio Sources Module
 
 from __future__ import annotations
 
+import functools
+import math
 import queue
 import time
 from abc import ABC, abstractmethod
@@ -71,6 +73,29 @@ class AudioSource(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _query_input_devices() -> tuple[AudioDevice, ...]:
+    """PortAudioから入力デバイス一覧を取得（結果はキャッシュされる）"""
+    raw_devices = sd.query_devices()
+
+    # デバイスが存在しない場合
+    if not isinstance(raw_devices, sd.DeviceList) or len(raw_devices) == 0:
+        return ()
+
+    default_input_device_id: int | None = sd.default.device[0]
+
+    return tuple(
+        AudioDevice(
+            id=device_id,
+            name=device_info["name"],
+            max_input_channels=device_info["max_input_channels"],
+            is_default=(device_id == default_input_device_id),
+        )
+        for device_id, device_info in enumerate(raw_devices)
+        if device_info["max_input_channels"] > 0
+    )
+
+
 class MicrophoneAudioSource(AudioSource):
     """
     マイク入力からの音声ソース
@@ -80,31 +105,22 @@ class MicrophoneAudioSource(AudioSource):
     """
 
     @staticmethod
-    def list_devices() -> list[AudioDevice]:
+    def list_devices() -> tuple[AudioDevice, ...]:
         """
         利用可能な入力デバイス一覧を取得する
 
+        PortAudioへの問い合わせ結果はキャッシュされる。
+        デバイスの抜き差しを反映するには refresh_devices() を呼ぶ。
+
         Returns:
-            list[AudioDevice]: 入力可能なオーディオデバイスのリスト
+            tuple[AudioDevice, ...]: 入力可能なオーディオデバイスの一覧
         """
-        raw_devices = sd.query_devices()
-
-        # デバイスが存在しない場合
-        if not isinstance(raw_devices, sd.DeviceList) or len(raw_devices) == 0:
-            return []
+        return _query_input_devices()
 
-        default_input_device_id: int | None = sd.default.device[0]
-
-        return [
-            AudioDevice(
-                id=device_id,
-                name=device_info["name"],
-                max_input_channels=device_info["max_input_channels"],
-                is_default=(device_id == default_input_device_id),
-            )
-            for device_id, device_info in enumerate(raw_devices)
-            if device_info["max_input_channels"] > 0
-        ]
+    @staticmethod
+    def refresh_devices() -> None:
+        """キャッシュ済みのデバイス一覧を破棄し、次回の list_devices() で再取得させる"""
+        _query_input_devices.cache_clear()
 
     def __init__(
         self,
@@ -125,6 +141,8 @@ class MicrophoneAudioSource(AudioSource):
         self._stream: sd.InputStream | None = None
         self._running: bool = False
         self._chunk_buffer: np.ndarray = np.array([], dtype=np.float32)
+        # コールバックで検出したステータス（通知はstream()側のスレッドで行う）
+        self._pending_status: sd.CallbackFlags | None = None
 
     def _audio_callback(
         self,
@@ -133,19 +151,33 @@ class MicrophoneAudioSource(AudioSource):
         _time_info: Any,
         status: sd.CallbackFlags,
     ) -> None:
-        """sounddeviceコールバック（非同期）"""
+        """
+        sounddeviceコールバック（非同期）
+
+        PortAudioのリアルタイムスレッドで実行されるため、I/Oやイベント発行は行わず
+        ステータスの記録とキューへの追加のみに留める。
+        """
         if status:
-            message_posted.send(
-                None,
-                event=MessagePostedEvent(
-                    message=f"Audio Error: {status}", level=MessageLevel.ERROR
-                ),
-            )
+            self._pending_status = status
 
         # モノラル変換してキューに追加
         audio = indata[:, 0].copy()
         self._queue.put(audio)
 
+    def _report_callback_status(self) -> None:
+        """コールバックで記録されたステータスを通知（非リアルタイムスレッドで実行）"""
+        status = self._pending_status
+        if status is None:
+            return
+
+        self._pending_status = None
+        message_posted.send(
+            None,
+            event=MessagePostedEvent(
+                message=f"Audio Error: {status}", level=MessageLevel.ERROR
+            ),
+        )
+
     def stream(self) -> Generator[np.ndarray, None, None]:
         """
         マイクからの音声データをチャンク単位で yield する
@@ -160,6 +192,7 @@ class MicrophoneAudioSource(AudioSource):
                 audio_block = self._queue.get(
                     timeout=self.audio_settings.queue_get_timeout_sec
                 )
+                self._report_callback_status()
                 self._chunk_buffer = np.append(self._chunk_buffer, audio_block)
 
                 # chunk_size単位でyield
@@ -179,9 +212,8 @@ class MicrophoneAudioSource(AudioSource):
             samplerate=self.core_settings.sample_rate,
             channels=1,
             dtype=np.float32,
-            blocksize=int(
-                self.core_settings.sample_rate * self.audio_settings.block_sec
-            ),
+            blocksize=self.core_settings.chunk_size * self.audio_settings.block_chunks,
+            latency=self.audio_settings.latency,
             callback=self._audio_callback,
         )
         self._stream.start()
@@ -200,14 +232,116 @@ class MicrophoneAudioSource(AudioSource):
         return True
 
 
+class _StreamingResampler:
+    """
+    ブロック単位で入力できるポリフェーズリサンプラ
+
+    scipy.signal.resample_poly と同じフィルタ設計（Kaiser窓FIR、β=5.0）と
+    位相合わせを行い、ブロックごとに処理しても一括処理と同じ出力を得る。
+    フィルタ長ぶんの入力履歴のみを保持するため、メモリ使用量はファイル長に依存しない。
+    """
+
+    def __init__(self, original_sr: int, target_sr: int) -> None:
+        """
+        Args:
+            original_sr: 入力サンプルレート
+            target_sr: 出力サンプルレート
+        """
+        # scipy は読み込みが重いため、リサンプリングが必要な場合のみ読み込む
+        # （マイク入力や --list-devices では不要）
+        from scipy.signal import firwin, upfirdn  # type: ignore[import-untyped]
+
+        self._upfirdn = upfirdn
+
+        divisor = math.gcd(target_sr, original_sr)
+        self._up = target_sr // divisor
+        self._down = original_sr // divisor
+
+        # resample_poly と同一のローパスFIRフィルタを設計
+        max_rate = max(self._up, self._down)
+        half_len = 10 * max_rate
+        h = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+        h = h.astype(np.float32) * self._up
+
+        # 出力サンプルがフィルタ中心に来るよう先頭をゼロ詰め
+        n_pre_pad = self._down - half_len % self._down
+        self._h: np.ndarray = np.concatenate((np.zeros(n_pre_pad, np.float32), h))
+        self._n_pre_remove = (half_len + n_pre_pad) // self._down
+
+        # 入力履歴（先頭の入力インデックスは常に down の倍数に揃える）
+        self._history: np.ndarray = np.zeros(0, dtype=np.float32)
+        self._history_start = 0
+        # これまでに受け取った入力サンプル数
+        self._n_in = 0
+        # 次に出力する upfirdn 出力インデックス（先頭の遅延分は捨てる）
+        self._next_out = self._n_pre_remove
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        入力ブロックを追加し、確定した出力サンプルを返す
+
+        Args:
+            block: 入力サンプルレートのモノラルfloat32音声データ
+
+        Returns:
+            np.ndarray: 出力サンプルレートのfloat32音声データ（空の場合あり）
+        """
+        self._history = np.concatenate((self._history, block))
+        self._n_in += len(block)
+
+        # 入力が揃っている（未来のサンプルに依存しない）出力インデックスの上限
+        ready_end = -(-self._n_in * self._up // self._down)
+        output = self._emit(self._history, ready_end)
+
+        # 次の出力に必要な入力だけを残す（down の倍数境界に揃えて位相を維持）
+        needed = max(
+            0, -(-(self._next_out * self._down - len(self._h) + 1) // self._up)
+        )
+        trim = (needed - self._history_start) // self._down * self._down
+        if trim > 0:
+            self._history = self._history[trim:]
+            self._history_start += trim
+
+        return output
+
+    def flush(self) -> np.ndarray:
+        """
+        入力終端以降をゼロとみなして残りの出力サンプルを返す
+
+        Returns:
+            np.ndarray: 出力サンプルレートのfloat32音声データ
+        """
+        n_out = -(-self._n_in * self._up // self._down)
+        tail = np.zeros(-(-len(self._h) // self._up) + 1, dtype=np.float32)
+        return self._emit(
+            np.concatenate((self._history, tail)), self._n_pre_remove + n_out
+        )
+
+    def _emit(self, history: np.ndarray, end: int) -> np.ndarray:
+        """upfirdn 出力インデックス [_next_out, end) を計算して返す"""
+        if end <= self._next_out or len(history) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # 履歴先頭は down の倍数なので、出力インデックスは整数オフセットで対応する
+        base = self._history_start * self._up // self._down
+        filtered: np.ndarray = self._upfirdn(self._h, history, self._up, self._down)
+        output = filtered[self._next_out - base : end - base]
+        self._next_out = end
+        return output.astype(np.float32, copy=False)
+
+
 class FileAudioSource(AudioSource):
     """
     音声ファイルからの音声ソース
 
     mp3/wav 等の音声ファイルを読み込み、VAD/Whisper の要件に合わせて
     16,000Hz モノラルにリサンプリング/変換する。
+    ファイルはブロック単位でストリーミング読み込みする。
     """
 
+    # soundfile から一度に読み込むフレーム数
+    _READ_BLOCK_FRAMES = 8192
+
     def __init__(
         self,
         core_settings: CoreSettings,
@@ -223,40 +357,49 @@ class FileAudioSource(AudioSource):
         self.core_settings = core_settings
         self.file_path = file_path
         self.realtime_simulation = realtime_simulation
-        self._audio_data: np.ndarray | None = None
+        self._original_sr: int | None = None
         self._duration: float = 0.0
 
-    def _load_audio(self) -> np.ndarray:
+    def _read_blocks(self) -> Generator[np.ndarray, None, None]:
         """
-        音声ファイルを読み込み、設定されたサンプルレートのモノラルに変換
+        音声ファイルをブロック単位で読み込み、設定されたサンプルレートのモノラルに変換
 
-        Returns:
+        ファイル全体をメモリに載せず、読み込み・モノラル化・リサンプリングを
+        ブロックごとに行う。
+
+        Yields:
             np.ndarray: 設定されたサンプルレートのモノラルfloat32音声データ
         """
-        # soundfileで読み込み（ネイティブサンプルレート）
-        audio_data, original_sr = sf.read(self.file_path, dtype="float32")
-
-        # ステレオの場合はモノラルに変換
-        if len(audio_data.shape) > 1:
-            audio_data = np.mean(audio_data, axis=1)
-
-        # リサンプリングが必要な場合
-        if original_sr != self.core_settings.sample_rate:
-            # 線形補間によるリサンプリング
-            original_length = len(audio_data)
-            target_length = int(
-                original_length * self.core_settings.sample_rate / original_sr
-            )
-            audio_data = np.interp(
-                np.linspace(0, original_length - 1, target_length),
-                np.arange(original_length),
-                audio_data,
-            ).astype(np.float32)
-
-        # 音声の長さを記録
-        self._duration = len(audio_data) / self.core_settings.sample_rate
-
-        return np.asarray(audio_data, dtype=np.float32)
+        if self._original_sr is None:
+            return
+
+        target_sr = self.core_settings.sample_rate
+        resampler = (
+            _StreamingResampler(self._original_sr, target_sr)
+            if self._original_sr != target_sr
+            else None
+        )
+
+        # soundfileでブロック単位に読み込み（ネイティブサンプルレート）
+        for block in sf.blocks(
+            self.file_path,
+            blocksize=self._READ_BLOCK_FRAMES,
+            dtype="float32",
+            always_2d=True,
+        ):
+            # モノラルに変換（モノラル入力はそのまま、多チャンネルはfloat32のまま平均）
+            if block.shape[1] == 1:
+                audio_data = block[:, 0]
+            else:
+                audio_data = block.mean(axis=1, dtype=np.float32)
+
+            if resampler is None:
+                yield audio_data
+            else:
+                yield resampler.process(audio_data)
+
+        if resampler is not None:
+            yield resampler.flush()
 
     def stream(self) -> Generator[np.ndarray, None, None]:
         """
@@ -265,37 +408,52 @@ class FileAudioSource(AudioSource):
         Yields:
             np.ndarray: chunk_sizeサンプルのfloat32音声データ
         """
-        if self._audio_data is None:
-            return
-
         chunk_size = self.core_settings.chunk_size
         # チャンクごとの時間（秒）
         chunk_duration = chunk_size / self.core_settings.sample_rate
 
-        # chunk_sizeごとにスライスしてyield
-        total_samples = len(self._audio_data)
-        for i in range(0, total_samples, chunk_size):
-            chunk = self._audio_data[i : i + chunk_size]
-
-            # 最後のチャンクが短い場合はゼロパディング
-            if len(chunk) < chunk_size:
-                chunk = np.pad(
-                    chunk, (0, chunk_size - len(chunk)), mode="constant"
-                ).astype(np.float32)
-
+        # リアルタイムシミュレーションの次チャンク送出時刻
+        # （消費側の処理時間を含めて実時間に同期させ、ドリフトを防ぐ）
+        deadline = time.monotonic()
+
+        # chunk_sizeに満たない端数を次のブロックに持ち越す
+        residual = np.zeros(0, dtype=np.float32)
+        for block in self._read_blocks():
+            audio_data = np.concatenate((residual, block))
+            n_full = len(audio_data) - len(audio_data) % chunk_size
+
+            # chunk_sizeごとにスライスしてyield
+            for i in range(0, n_full, chunk_size):
+                yield audio_data[i : i + chunk_size]
+
+                # リアルタイムシミュレーションの場合は待機
+                if self.realtime_simulation:
+                    deadline += chunk_duration
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+
+            residual = audio_data[n_full:]
+
+        # 最後のチャンクが短い場合はゼロパディング
+        if len(residual) > 0:
+            chunk = np.zeros(chunk_size, dtype=np.float32)
+            chunk[: len(residual)] = residual
             yield chunk
 
-            # リアルタイムシミュレーションの場合は待機
-            if self.realtime_simulation:
-                time.sleep(chunk_duration)
-
     def start(self) -> None:
-        """音声ファイルを読み込み"""
-        self._audio_data = self._load_audio()
+        """音声ファイルのメタデータを読み込み"""
+        info = sf.info(self.file_path)
+        self._original_sr = int(info.samplerate)
+
+        # 音声の長さを記録（リサンプリング後のサンプル数から算出）
+        target_sr = self.core_settings.sample_rate
+        target_frames = -(-info.frames * target_sr // self._original_sr)
+        self._duration = target_frames / target_sr
 
     def stop(self) -> None:
         """リソースのクリーンアップ"""
-        self._audio_data = None
+        self._original_sr = None
 
     @property
     def is_realtime(self) -> bool:
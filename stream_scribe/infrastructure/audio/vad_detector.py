@@ -4,6 +4,9 @@ Stream Scribe - VAD Module
 Silero VADによる音声検知を提供するモジュール
 """
 
+import hashlib
+import os
+import shutil
 from pathlib import Path
 
 import numpy as np
@@ -51,21 +54,56 @@ class VADDetector:
             ),
         )
 
-        # モデルの自動ダウンロード
-        if auto_download and not vad_model_settings.model_path.exists():
-            self._download_model(vad_model_settings.model_path, vad_model_settings.url)
+        # モデルの自動ダウンロード（ハッシュ指定時は既存ファイルも検証）
+        if auto_download and not self._is_model_valid(
+            vad_model_settings.model_path, vad_model_settings.sha256
+        ):
+            self._download_model(
+                vad_model_settings.model_path,
+                vad_model_settings.url,
+                vad_model_settings.sha256,
+            )
 
         # ONNX Runtimeセッション（CPU最適化）
+        # モデルが小さく1チャンクずつ推論するため、スレッド並列はオーバーヘッドにしかならない
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        session_options.intra_op_num_threads = 1
+        session_options.inter_op_num_threads = 1
+        session_options.enable_mem_pattern = True
+        session_options.enable_cpu_mem_arena = True
         self.session = ort.InferenceSession(
-            str(vad_model_settings.model_path), providers=["CPUExecutionProvider"]
+            str(vad_model_settings.model_path),
+            sess_options=session_options,
+            providers=["CPUExecutionProvider"],
         )
 
-        # LSTM内部状態の初期化（batch=1, hidden=128）
-        self.reset_states()
-
+        # 推論用バッファを事前確保し、IOBindingで一度だけバインドする
+        # （OrtValueはNumPy配列のメモリを共有するため、以降は配列の中身を書き換えるだけ）
+        self._input = np.zeros((1, core_settings.chunk_size), dtype=np.float32)
+        self._output = np.zeros((1, 1), dtype=np.float32)
+        self.state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._next_state = np.zeros_like(self.state)
         # サンプルレート（ONNXモデルは16000固定）
         self._sr = np.array(core_settings.sample_rate, dtype=np.int64)
 
+        self._io_binding = self.session.io_binding()
+        for name, array in (
+            ("input", self._input),
+            ("state", self.state),
+            ("sr", self._sr),
+        ):
+            self._io_binding.bind_ortvalue_input(
+                name, ort.OrtValue.ortvalue_from_numpy(array)
+            )
+        for name, array in (("output", self._output), ("stateN", self._next_state)):
+            self._io_binding.bind_ortvalue_output(
+                name, ort.OrtValue.ortvalue_from_numpy(array)
+            )
+
         message_posted.send(
             None,
             event=MessagePostedEvent(
@@ -74,7 +112,22 @@ class VADDetector:
         )
 
     @staticmethod
-    def _download_model(model_path: Path, url: str) -> None:
+    def _file_sha256(path: Path) -> str:
+        """ファイルのSHA-256を計算"""
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @classmethod
+    def _is_model_valid(cls, model_path: Path, sha256: str | None) -> bool:
+        """モデルファイルが存在し、ハッシュ指定時はそれと一致するか"""
+        if not model_path.exists():
+            return False
+        if sha256 is None:
+            return True
+        return cls._file_sha256(model_path) == sha256.lower()
+
+    @classmethod
+    def _download_model(cls, model_path: Path, url: str, sha256: str | None) -> None:
         """Silero VADモデルを自動ダウンロード"""
         message_posted.send(
             None,
@@ -84,12 +137,22 @@ class VADDetector:
         )
         model_path.parent.mkdir(parents=True, exist_ok=True)
 
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        # 一時ファイルに書き出してから置き換える（中断時に壊れたモデルを残さない）
+        partial_path = model_path.with_name(model_path.name + ".part")
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            with open(partial_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                f.flush()
+                os.fsync(f.fileno())
 
-        with open(model_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        if sha256 is not None and cls._file_sha256(partial_path) != sha256.lower():
+            partial_path.unlink()
+            raise ValueError(f"SHA-256 mismatch for downloaded VAD model: {url}")
+
+        os.replace(partial_path, model_path)
 
         message_posted.send(
             None,
@@ -100,7 +163,18 @@ class VADDetector:
 
     def reset_states(self) -> None:
         """LSTM状態をリセット"""
-        self.state = np.zeros((2, 1, 128), dtype=np.float32)
+        self.state.fill(0.0)
+
+    def _run(self, audio_chunk: np.ndarray) -> float:
+        """バインド済みバッファに入力を書き込み、1チャンク分の推論を実行"""
+        np.copyto(self._input[0], audio_chunk)
+        self.session.run_with_iobinding(self._io_binding)
+
+        # 次回推論用にLSTM状態を更新（バインド済みの配列へ書き戻す）
+        np.copyto(self.state, self._next_state)
+
+        # 確率値を返す（output shape: (1, 1)）
+        return float(self._output[0, 0])
 
     def __call__(self, audio_chunk: np.ndarray) -> float:
         """
@@ -112,18 +186,25 @@ class VADDetector:
         Returns:
             probability: 音声確率（0.0-1.0）
         """
-        # 入力のリシェイプ（batch, samples）
-        audio_input = audio_chunk.reshape(1, -1)
+        return self._run(audio_chunk)
 
-        # ONNX推論
-        ort_inputs = {
-            "input": audio_input,
-            "state": self.state,
-            "sr": self._sr,
-        }
+    def process_batch(self, chunks: np.ndarray) -> np.ndarray:
+        """
+        複数チャンクのVAD推論をまとめて実行（非リアルタイム入力向け）
 
-        output, self.state = self.session.run(None, ort_inputs)
+        LSTM状態は時間方向に依存するため、チャンクをバッチ次元に積んで
+        独立に推論することはできない。状態を引き継ぎながら順に推論する。
 
-        # 確率値を返す（output shape: (1, 1)）
-        probability = float(output.squeeze().item())
-        return probability
+        Args:
+            chunks: (B, 512) float32 audio data
+
+        Returns:
+            probabilities: (B,) 音声確率（0.0-1.0）
+        """
+        probabilities = np.empty(len(chunks), dtype=np.float32)
+        run = self._run
+
+        for i, chunk in enumerate(chunks):
+            probabilities[i] = run(chunk)
+
+        return probabilities
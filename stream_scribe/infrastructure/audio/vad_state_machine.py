@@ -4,18 +4,31 @@ Stream Scribe - VAD State Machine Module
 VAD（音声活動検出）の状態遷移ロジックを管理するモジュール
 """
 
-from enum import Enum, auto
+from collections.abc import Iterable
+from enum import IntEnum
 
 from stream_scribe.domain import VADDetectionSettings
 
 
-class VadAction(Enum):
-    """VAD状態遷移によって発生するアクション"""
+class VadAction(IntEnum):
+    """
+    VAD状態遷移によって発生するアクション
+
+    毎チャンク評価されるため整数値で比較できるIntEnumとし、
+    NONE を 0（偽）にして `if action:` で何もしないケースを即座に除外できるようにする。
+    """
+
+    NONE = 0
+    START_RECORDING = 1
+    STOP_RECORDING = 2
+    RESET_VAD_MODEL = 3
 
-    NONE = auto()
-    START_RECORDING = auto()
-    STOP_RECORDING = auto()
-    RESET_VAD_MODEL = auto()
+
+# ホットパスで返すメンバーをモジュール定数に束縛（クラス属性の参照を省く）
+_NONE = VadAction.NONE
+_START_RECORDING = VadAction.START_RECORDING
+_STOP_RECORDING = VadAction.STOP_RECORDING
+_RESET_VAD_MODEL = VadAction.RESET_VAD_MODEL
 
 
 class VadStateMachine:
@@ -34,6 +47,13 @@ class VadStateMachine:
         self.silence_chunks = 0
         self.idle_silence_chunks = 0
 
+        # チャンクごとに参照する設定値をキャッシュ（ホットパスの属性アクセス削減）
+        # 閾値は is_recording（False=0, True=1）で引く: 待機中は開始閾値、録音中は終了閾値
+        self._thresholds = (settings.start_threshold, settings.end_threshold)
+        self._min_speech_chunks = settings.min_speech_chunks
+        self._max_silence_chunks = settings.max_silence_chunks
+        self._idle_reset_chunks = settings.idle_reset_chunks
+
     def process(self, probability: float) -> VadAction:
         """
         VAD確率を処理し、状態遷移に基づくアクションを返す
@@ -44,19 +64,76 @@ class VadStateMachine:
         Returns:
             VadAction: 実行すべきアクション
         """
-        is_speech = self._evaluate_threshold(probability)
-        if is_speech:
+        if self._evaluate_threshold(probability):
             return self._handle_speech()
-        else:
-            return self._handle_silence()
+        return self._handle_silence()
+
+    def process_batch(self, probabilities: Iterable[float]) -> list[VadAction]:
+        """
+        複数のVAD確率をまとめて処理する（非リアルタイム入力向け）
+
+        process() を順に呼び出した場合と同じ状態遷移を、カウンタをローカル変数に
+        載せた単一のループで行う。VADモデルのリセットを伴うアクション
+        （STOP_RECORDING / RESET_VAD_MODEL）が発生した時点で処理を打ち切る。
+        以降の確率はリセット前のLSTM状態で推論されており、再推論が必要なため。
+
+        Args:
+            probabilities: VADモデルから出力された音声確率の列 (0.0-1.0)
+
+        Returns:
+            list[VadAction]: 処理した確率ごとのアクション（入力より短い場合あり）
+        """
+        start_threshold, end_threshold = self._thresholds
+        min_speech_chunks = self._min_speech_chunks
+        max_silence_chunks = self._max_silence_chunks
+        idle_reset_chunks = self._idle_reset_chunks
+
+        is_recording = self.is_recording
+        speech_chunks = self.speech_chunks
+        silence_chunks = self.silence_chunks
+        idle_silence_chunks = self.idle_silence_chunks
+
+        actions: list[VadAction] = []
+        for probability in probabilities:
+            threshold = end_threshold if is_recording else start_threshold
+            action = _NONE
+
+            if probability >= threshold:
+                # 音声検出
+                silence_chunks = 0
+                idle_silence_chunks = 0
+                speech_chunks += 1
+                if not is_recording and speech_chunks >= min_speech_chunks:
+                    is_recording = True
+                    action = _START_RECORDING
+            else:
+                # 無音検出
+                speech_chunks = 0
+                if is_recording:
+                    silence_chunks += 1
+                    if silence_chunks >= max_silence_chunks:
+                        is_recording = False
+                        silence_chunks = 0
+                        action = _STOP_RECORDING
+                else:
+                    idle_silence_chunks += 1
+                    if idle_silence_chunks >= idle_reset_chunks:
+                        idle_silence_chunks = 0
+                        action = _RESET_VAD_MODEL
+
+            actions.append(action)
+            if action == _STOP_RECORDING or action == _RESET_VAD_MODEL:
+                break
+
+        self.is_recording = is_recording
+        self.speech_chunks = speech_chunks
+        self.silence_chunks = silence_chunks
+        self.idle_silence_chunks = idle_silence_chunks
+        return actions
 
     def _evaluate_threshold(self, probability: float) -> bool:
-        """ヒステリシス制御で閾値を切り替え"""
-        if self.is_recording:
-            # 録音中は低い閾値（語尾保護）
-            return probability >= self.settings.end_threshold
-        # 待機中は高い閾値（ノイズ対策）
-        return probability >= self.settings.start_threshold
+        """ヒステリシス制御で閾値を切り替え（待機中は高い閾値、録音中は低い閾値）"""
+        return probability >= self._thresholds[self.is_recording]
 
     def _handle_speech(self) -> VadAction:
         """音声検出時の処理"""
@@ -64,14 +141,11 @@ class VadStateMachine:
         self.idle_silence_chunks = 0
         self.speech_chunks += 1
 
-        if (
-            not self.is_recording
-            and self.speech_chunks >= self.settings.min_speech_chunks
-        ):
+        if not self.is_recording and self.speech_chunks >= self._min_speech_chunks:
             self.is_recording = True
-            return VadAction.START_RECORDING
+            return _START_RECORDING
 
-        return VadAction.NONE
+        return _NONE
 
     def _handle_silence(self) -> VadAction:
         """無音検出時の処理"""
@@ -79,16 +153,16 @@ class VadStateMachine:
 
         if self.is_recording:
             self.silence_chunks += 1
-            if self.silence_chunks >= self.settings.max_silence_chunks:
+            if self.silence_chunks >= self._max_silence_chunks:
                 self._reset_recording_state()
-                return VadAction.STOP_RECORDING
+                return _STOP_RECORDING
         else:
             self.idle_silence_chunks += 1
-            if self.idle_silence_chunks >= self.settings.idle_reset_chunks:
+            if self.idle_silence_chunks >= self._idle_reset_chunks:
                 self.idle_silence_chunks = 0
-                return VadAction.RESET_VAD_MODEL
+                return _RESET_VAD_MODEL
 
-        return VadAction.NONE
+        return _NONE
 
     def _reset_recording_state(self) -> None:
         """録音状態をリセット"""
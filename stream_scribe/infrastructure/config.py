@@ -4,8 +4,8 @@ Stream Scribe - Configuration Loader
 設定の読み込み（TOML）
 """
 
+import functools
 import tomllib
-from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -14,28 +14,28 @@ from stream_scribe.domain import Settings
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
-    2つの辞書を深くマージする（overrideが優先）
+    overrideをbaseへ深くマージする（overrideが優先）
+
+    baseを直接更新する（コピーしない）。両方がテーブルのキーのみ再帰し、
+    [vad.detection] のような入れ子セクションも項目単位で上書きする。
 
     Args:
-        base: ベースとなる辞書
+        base: ベースとなる辞書（更新される）
         override: 上書きする辞書
 
     Returns:
-        マージされた辞書
+        マージされた辞書（base自身）
     """
-    result = base.copy()
     for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], Mapping)
-            and isinstance(value, Mapping)
-        ):
-            result[key] = _deep_merge(dict(result[key]), dict(value))
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_merge(current, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
+    return base
 
 
+@functools.cache
 def load_settings() -> Settings:
     """
     TOMLファイルから設定を読み込む
@@ -45,6 +45,8 @@ def load_settings() -> Settings:
     2. {project_root}/config.toml（存在する場合）
     3. {project_root}/config.local.toml（存在する場合）
 
+    TOMLの読み込みはプロセス内で一度だけ行い、以降は同じインスタンスを返す。
+
     Returns:
         Settingsインスタンス
     """
@@ -4,9 +4,12 @@ Stream Scribe - Hallucination Filter
 幻覚フィルタリングを提供するモジュール（日本語最適化版）
 """
 
+import functools
 import re
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Final
+
+import numpy as np
 
 from stream_scribe.domain import HallucinationFilterSettings
 
@@ -24,8 +27,36 @@ class HallucinationFilter:
     日本語環境での音声認識幻覚に特化した検出ロジック
     """
 
-    # 日本語句読点パターン（コンパイル済み）
-    _JAPANESE_PUNCTUATION_PATTERN = re.compile(r"[。、！？\s]+")
+    # インスタンス属性を固定（__dict__ を持たず、属性アクセスをスロット参照に）
+    __slots__ = (
+        "_banned_phrase_pattern",
+        "_char_repetition_pattern",
+        "_evaluate_text_patterns",
+        "_greeting_phrase_pattern",
+        "settings",
+    )
+
+    # 日本語句読点・空白（正規表現の \s と同じ範囲）を区切り文字 "\0" に置換する変換表
+    # （正規表現での分割の代わりに str.translate + str.split で分割する）
+    _TOKEN_SEPARATOR: Final = "\0"
+    _JAPANESE_PUNCTUATION_TABLE: Final = str.maketrans(
+        dict.fromkeys(
+            "。、！？" + "".join(c for c in map(chr, range(0x3001)) if c.isspace()),
+            _TOKEN_SEPARATOR,
+        )
+    )
+
+    # この文字数を超えるテキストは文字連続の検出をNumPyで行う
+    # （短いテキストでは配列生成のオーバーヘッドが上回るため正規表現を使う）
+    _VECTORIZED_CHAR_RUN_MIN_LENGTH: Final = 300
+
+    # この文字数以下のテキストのみ文字種数による早期棄却を試す
+    # （長い自然文では文字種数が上限を超えにくく、set() の構築が無駄になるため）
+    _DISTINCT_CHAR_PREFILTER_MAX_LENGTH: Final = 200
+
+    # テキストのみに依存する判定結果をキャッシュする件数
+    # （リトライで同じ幻覚テキストが繰り返し出力されることが多いため）
+    _TEXT_PATTERN_CACHE_SIZE: Final = 256
 
     def __init__(self, settings: HallucinationFilterSettings):
         """
@@ -34,6 +65,62 @@ class HallucinationFilter:
         """
         self.settings = settings
 
+        # フレーズ群を1つの正規表現（リテラルの選択）にまとめておき、1回の走査で有無を判定
+        self._banned_phrase_pattern = self._compile_phrase_pattern(
+            settings.banned_phrases
+        )
+        self._greeting_phrase_pattern = self._compile_phrase_pattern(
+            settings.contextless_greeting_phrases
+        )
+        # 同一文字が min_char_repetition 回以上連続する箇所（改行・空白も対象）
+        self._char_repetition_pattern = re.compile(
+            rf"(.)\1{{{settings.min_char_repetition - 1},}}", re.DOTALL
+        )
+        # テキストのみに依存する判定はテキストをキーにインスタンスごとにキャッシュ
+        # （設定はインスタンス生成後に変わらないため、結果はテキストだけで決まる）
+        self._evaluate_text_patterns = functools.lru_cache(
+            maxsize=self._TEXT_PATTERN_CACHE_SIZE
+        )(self._check_text_patterns)
+
+    @staticmethod
+    def _compile_phrase_pattern(phrases: Sequence[str]) -> re.Pattern[str] | None:
+        """
+        フレーズリストをいずれかに一致する正規表現にコンパイル
+
+        Args:
+            phrases: 検出対象のフレーズリスト
+
+        Returns:
+            re.Pattern | None: コンパイル済みパターン（フレーズがない場合はNone）
+        """
+        if not phrases:
+            return None
+        # 長いフレーズを優先（同じ位置で短いフレーズに先に一致させない）
+        ordered = sorted(set(phrases), key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, ordered)))
+
+    @staticmethod
+    def _find_first_phrase(
+        pattern: re.Pattern[str] | None, phrases: Sequence[str], text: str
+    ) -> str | None:
+        """
+        テキストに含まれるフレーズのうち、リスト順で最初のものを返す
+
+        まずコンパイル済みパターンで有無だけを1回の走査で判定し、
+        一致した場合のみリスト順に探して報告するフレーズを決める。
+
+        Args:
+            pattern: _compile_phrase_pattern で作成したパターン
+            phrases: フレーズリスト
+            text: チェック対象のテキスト
+
+        Returns:
+            str | None: 一致したフレーズ or None
+        """
+        if pattern is None or pattern.search(text) is None:
+            return None
+        return next((phrase for phrase in phrases if phrase in text), None)
+
     def evaluate_transcription(
         self,
         text: str,
@@ -57,24 +144,14 @@ class HallucinationFilter:
         if not text or not text.strip():
             return None
 
-        # 各検出メソッドを順次実行（早期リターン）
-        if reason := self._check_banned_phrases(text):
-            return reason
-
-        if reason := self._check_character_repetition(text):
-            return reason
-
-        if reason := self._check_short_pattern_repetition(text):
-            return reason
-
-        if reason := self._check_long_pattern_repetition(text):
-            return reason
-
-        if reason := self._check_token_repetition(text):
+        # テキストパターンの判定（同じテキストはキャッシュから返る）
+        reason, normalized_text = self._evaluate_text_patterns(text)
+        if reason:
             return reason
 
+        # 信頼度・音声長に依存する判定は毎回行う
         if reason := self._check_contextless_greeting(
-            text, avg_logprob, audio_duration
+            normalized_text, avg_logprob, audio_duration
         ):
             return reason
 
@@ -83,6 +160,44 @@ class HallucinationFilter:
 
         return None
 
+    def _check_text_patterns(self, text: str) -> tuple[str | None, str]:
+        """
+        テキストのみに依存する幻覚パターンを評価
+
+        Args:
+            text: 空白以外の文字を含む文字起こしテキスト
+
+        Returns:
+            tuple: (破棄理由 or None, 句読点・空白を除去したテキスト)
+        """
+        # 各検出メソッドを順次実行（早期リターン）
+        if reason := self._check_banned_phrases(text):
+            return reason, ""
+
+        if reason := self._check_character_repetition(text):
+            return reason, ""
+
+        if reason := self._check_short_pattern_repetition(text):
+            return reason, ""
+
+        if reason := self._check_long_pattern_repetition(text):
+            return reason, ""
+
+        # 句読点・空白での分割結果を両チェックで共有（分割は1回だけ）
+        # 分割片は句読点・空白を含まないため、連結すれば除去後のテキストと一致する
+        tokens = [
+            t
+            for t in text.translate(self._JAPANESE_PUNCTUATION_TABLE).split(
+                self._TOKEN_SEPARATOR
+            )
+            if t
+        ]
+
+        if reason := self._check_token_repetition(tokens):
+            return reason, ""
+
+        return None, "".join(tokens)
+
     def _check_banned_phrases(self, text: str) -> str | None:
         """
         ブラックリストフレーズ検出
@@ -93,14 +208,16 @@ class HallucinationFilter:
         Returns:
             str | None: 破棄理由 or None
         """
-        for phrase in self.settings.banned_phrases:
-            if phrase in text:
-                return f"Banned phrase: '{phrase}'"
+        phrase = self._find_first_phrase(
+            self._banned_phrase_pattern, self.settings.banned_phrases, text
+        )
+        if phrase is not None:
+            return f"Banned phrase: '{phrase}'"
         return None
 
     def _check_character_repetition(self, text: str) -> str | None:
         """
-        文字レベルの繰り返し検出（O(n)）
+        文字レベルの繰り返し検出（O(n)、コンパイル済み正規表現）
 
         同じ文字が連続して出現する場合を検出
         例: "ああああああああああ"
@@ -111,24 +228,51 @@ class HallucinationFilter:
         Returns:
             str | None: 破棄理由 or None
         """
+        min_repetition = self.settings.min_char_repetition
         text_len = len(text)
-        if text_len < self.settings.min_char_repetition:
+        if text_len < min_repetition:
             return None
 
-        consecutive_count = 1
-        prev_char = text[0]
+        if text_len > self._VECTORIZED_CHAR_RUN_MIN_LENGTH:
+            char = self._find_character_run(text, min_repetition)
+        else:
+            # 連続の検出は正規表現エンジン（C実装）に任せる
+            match = self._char_repetition_pattern.search(text)
+            char = match.group(1) if match else None
 
-        for char in text[1:]:
-            if char == prev_char:
-                consecutive_count += 1
-                if consecutive_count >= self.settings.min_char_repetition:
-                    return f"Character repetition: '{char}' x{consecutive_count}+"
-            else:
-                consecutive_count = 1
-                prev_char = char
+        if char is not None:
+            return f"Character repetition: '{char}' x{min_repetition}+"
 
         return None
 
+    @staticmethod
+    def _find_character_run(text: str, min_length: int) -> str | None:
+        """
+        min_length 回以上連続する最初の文字をNumPyで探す（長いテキスト向け）
+
+        Args:
+            text: チェック対象のテキスト
+            min_length: 連続とみなす最小回数
+
+        Returns:
+            str | None: 最初に見つかった連続文字 or None
+        """
+        codepoints = np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+        )
+        # 文字が切り替わる位置を境界として各連続の長さを求める
+        boundaries = np.concatenate(
+            (
+                [0],
+                np.flatnonzero(codepoints[1:] != codepoints[:-1]) + 1,
+                [len(codepoints)],
+            )
+        )
+        long_runs = np.flatnonzero(np.diff(boundaries) >= min_length)
+        if len(long_runs) == 0:
+            return None
+        return text[boundaries[long_runs[0]]]
+
     def _check_short_pattern_repetition(self, text: str) -> str | None:
         """
         短いパターンの繰り返し検出（2-10文字）
@@ -146,17 +290,40 @@ class HallucinationFilter:
         if text_len < 20:
             return None
 
+        # ループ内で参照する設定値はローカル変数に束縛しておく
+        min_repetition = self.settings.min_short_pattern_repetition
+        ratio_threshold = self.settings.repetition_ratio_threshold
+        start_positions = self.settings.pattern_search_start_positions
+        required_coverage = text_len * ratio_threshold
+        count = text.count
+
+        max_pattern_len = min(self.settings.short_pattern_max_length, text_len // 3)
+
+        # 文字種数による早期棄却：長さL以下のパターンが閾値以上を占めるなら、
+        # 文字種数は「パターン内のL種 + 繰り返し以外の文字数」を超えない
+        if text_len <= self._DISTINCT_CHAR_PREFILTER_MAX_LENGTH:
+            uncovered_len = text_len - int(required_coverage)
+            if len(set(text)) > max_pattern_len + uncovered_len:
+                return None
+
+        # 候補の開始位置にある文字の出現回数（開始位置ごとに1回だけ数え、全パターン長で共有）
+        # パターンの各出現（重複なし）は先頭文字を1つずつ含むため、
+        # パターンの出現回数は先頭文字の出現回数を超えない
+        head_counts = [count(char) for char in text[:start_positions]]
+
         # パターン長を短いものから長いものへ
-        for pattern_len in range(
-            2, min(self.settings.short_pattern_max_length + 1, text_len // 3 + 1)
-        ):
+        for pattern_len in range(2, max_pattern_len + 1):
             # テキストの最初の数箇所をパターン候補として試行
-            max_start = min(
-                self.settings.pattern_search_start_positions,
-                text_len - pattern_len * 3 + 1,
-            )
+            max_start = min(start_positions, text_len - pattern_len * 3 + 1)
+
+            # 検出に必要な出現回数の下限（回数条件と割合条件の両方から）
+            required_count = max(min_repetition, int(required_coverage / pattern_len))
 
             for start in range(max_start):
+                # 先頭文字の出現回数が足りなければ text.count するまでもない
+                if head_counts[start] < required_count:
+                    continue
+
                 pattern = text[start : start + pattern_len]
 
                 # 空白やスペースだけのパターンはスキップ
@@ -164,13 +331,13 @@ class HallucinationFilter:
                     continue
 
                 # パターンの出現回数をカウント
-                count = text.count(pattern)
-                if count >= self.settings.min_short_pattern_repetition:
-                    # 繰り返しがテキスト全体の閾値以上を占めるかチェック
-                    if (
-                        pattern_len * count
-                    ) >= text_len * self.settings.repetition_ratio_threshold:
-                        return f"Pattern repetition: '{pattern[:30]}...' x{count}"
+                pattern_count = count(pattern)
+                # 最小繰り返し回数以上で、かつテキスト全体の閾値以上を占めるかチェック
+                if (
+                    pattern_count >= min_repetition
+                    and pattern_len * pattern_count >= required_coverage
+                ):
+                    return f"Pattern repetition: '{pattern[:30]}...' x{pattern_count}"
 
         return None
 
@@ -191,6 +358,8 @@ class HallucinationFilter:
         if text_len < 60:
             return None
 
+        min_repetition = self.settings.min_long_pattern_repetition
+        required_coverage = text_len * self.settings.repetition_ratio_threshold
         max_pattern_len = min(self.settings.long_pattern_max_length, text_len // 3)
 
         # 5文字刻みでチェック（計算量削減）
@@ -203,15 +372,16 @@ class HallucinationFilter:
                 continue
 
             count = text.count(pattern)
-            if count >= self.settings.min_long_pattern_repetition:
-                if (
-                    pattern_len * count
-                ) >= text_len * self.settings.repetition_ratio_threshold:
-                    return f"Long phrase repetition: '{pattern[:30]}...' x{count}"
+            if count < min_repetition:
+                # 候補はすべて先頭からの接頭辞なので、長い候補の重複なし出現回数は
+                # 短い候補の出現回数を超えない（以降の候補も回数条件を満たさない）
+                break
+            if pattern_len * count >= required_coverage:
+                return f"Long phrase repetition: '{pattern[:30]}...' x{count}"
 
         return None
 
-    def _check_token_repetition(self, text: str) -> str | None:
+    def _check_token_repetition(self, tokens: list[str]) -> str | None:
         """
         日本語トークンレベルの末尾繰り返し検出
 
@@ -219,25 +389,17 @@ class HallucinationFilter:
         例: "はい。はい。はい。はい。はい。"
 
         Args:
-            text: チェック対象のテキスト
+            tokens: 日本語句読点・空白で分割した空でないトークン列
 
         Returns:
             str | None: 破棄理由 or None
         """
-        # 日本語句読点で分割
-        tokens = self._JAPANESE_PUNCTUATION_PATTERN.split(text)
-
-        # 空文字列を除去
-        tokens = [t for t in tokens if t.strip()]
-
-        # 末尾で同じトークンが連続する場合は幻覚
-        if len(tokens) >= self.settings.min_token_repetition:
+        # 末尾で同じトークンが連続する場合は幻覚（末尾スライスを一括比較）
+        min_repetition = self.settings.min_token_repetition
+        if len(tokens) >= min_repetition:
             last_token = tokens[-1]
-            if last_token and all(
-                tokens[-i] == last_token
-                for i in range(1, self.settings.min_token_repetition + 1)
-            ):
-                return f"Token repetition at end: '{last_token}' x{self.settings.min_token_repetition}+"
+            if tokens[-min_repetition:] == [last_token] * min_repetition:
+                return f"Token repetition at end: '{last_token}' x{min_repetition}+"
 
         return None
 
@@ -258,36 +420,36 @@ class HallucinationFilter:
         if not segments:
             return None, None, None
 
+        # 1回の走査で3指標を集計（中間リストを作らない）
         # avg_logprob: 全セグメントの平均
-        logprobs: list[float] = [
-            s["avg_logprob"]
-            for s in segments
-            if "avg_logprob" in s and isinstance(s["avg_logprob"], (int, float))
-        ]
-        avg_logprob = sum(logprobs) / len(logprobs) if logprobs else None
-
-        # compression_ratio: 最大値（最も疑わしい値を採用）
-        ratios: list[float] = [
-            s["compression_ratio"]
-            for s in segments
-            if "compression_ratio" in s
-            and isinstance(s["compression_ratio"], (int, float))
-        ]
-        compression_ratio = max(ratios) if ratios else None
+        # compression_ratio / no_speech_prob: 最大値（最も疑わしい値を採用）
+        logprob_sum = 0.0
+        logprob_count = 0
+        compression_ratio: float | None = None
+        no_speech_prob: float | None = None
+        for s in segments:
+            value = s.get("avg_logprob")
+            if isinstance(value, (int, float)):
+                logprob_sum += value
+                logprob_count += 1
+            value = s.get("compression_ratio")
+            if isinstance(value, (int, float)) and (
+                compression_ratio is None or value > compression_ratio
+            ):
+                compression_ratio = value
+            value = s.get("no_speech_prob")
+            if isinstance(value, (int, float)) and (
+                no_speech_prob is None or value > no_speech_prob
+            ):
+                no_speech_prob = value
 
-        # no_speech_prob: 最大値（最も疑わしい値を採用）
-        no_speech_probs: list[float] = [
-            s["no_speech_prob"]
-            for s in segments
-            if "no_speech_prob" in s and isinstance(s["no_speech_prob"], (int, float))
-        ]
-        no_speech_prob = max(no_speech_probs) if no_speech_probs else None
+        avg_logprob = logprob_sum / logprob_count if logprob_count else None
 
         return avg_logprob, compression_ratio, no_speech_prob
 
     def _check_contextless_greeting(
         self,
-        text: str,
+        normalized_text: str,
         avg_logprob: float | None,
         audio_duration: float | None,
     ) -> str | None:
@@ -301,22 +463,19 @@ class HallucinationFilter:
            - 長尺音声中の短文（音声長が閾値以上かつテキストが短い）
 
         Args:
-            text: チェック対象のテキスト
+            normalized_text: 句読点・空白を除去したテキスト
             avg_logprob: セグメントの平均対数確率
             audio_duration: 音声の長さ（秒）
 
         Returns:
             str | None: 破棄理由 or None
         """
-        # テキストから句読点・空白を除去して正規化
-        normalized_text = self._JAPANESE_PUNCTUATION_PATTERN.sub("", text)
-
         # 挨拶フレーズが含まれているかチェック
-        matched_greeting = None
-        for phrase in self.settings.contextless_greeting_phrases:
-            if phrase in normalized_text:
-                matched_greeting = phrase
-                break
+        matched_greeting = self._find_first_phrase(
+            self._greeting_phrase_pattern,
+            self.settings.contextless_greeting_phrases,
+            normalized_text,
+        )
 
         if not matched_greeting:
             return None
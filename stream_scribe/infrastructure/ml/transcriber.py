@@ -4,9 +4,9 @@ Stream Scribe - Transcriber Module
 MLX Whisperによる文字起こしを提供するモジュール
 """
 
-import queue
 import threading
 import time
+from collections import deque
 from datetime import datetime
 
 import mlx_whisper  # type: ignore[import-untyped]
@@ -42,14 +42,31 @@ class Transcriber(threading.Thread):
         hallucination_filter: HallucinationFilter,
         core_settings: CoreSettings,
         whisper_settings: WhisperSettings,
+        max_queued_chunks: int | None = None,
     ) -> None:
+        """
+        Args:
+            hallucination_filter: 幻覚フィルタ
+            core_settings: コア設定
+            whisper_settings: Whisper設定
+            max_queued_chunks: 待ち音声の上限（超えると最も古い音声を破棄、Noneで無制限）
+        """
         super().__init__(daemon=True)
-        self.queue: queue.Queue[tuple[np.ndarray, datetime, datetime]] = queue.Queue()
+        # 音声キュー（単一プロデューサ・単一コンシューマ）
+        # deque の両端操作はスレッドセーフなため、ロックを取らずに受け渡す
+        # 上限付きの場合、満杯での追加は deque が最も古い要素を捨てる
+        self.queue: deque[tuple[np.ndarray, datetime, datetime]] = deque(
+            maxlen=max_queued_chunks
+        )
+        self._audio_available = threading.Event()  # キュー追加・停止の通知
+        self._progress = threading.Condition()  # 1件の処理完了・待機開始の通知
         self.running = True
         self._processing = False  # 現在処理中かどうか
         self.core_settings = core_settings
         self.whisper_settings = whisper_settings
         self.hallucination_filter = hallucination_filter  # 幻覚フィルター
+        # リトライ戦略（音声ごとに reset して再利用し、パラメータの dict 化を1回に）
+        self._strategy = TranscriptionRetryStrategy(whisper_settings)
 
         message_posted.send(
             None,
@@ -92,26 +109,73 @@ class Transcriber(threading.Thread):
         self, audio: np.ndarray, start_time: datetime, end_time: datetime
     ) -> None:
         """音声データをキューに追加"""
-        if self.running:
-            self.queue.put((audio, start_time, end_time))
+        if not self.running:
+            return
+
+        # 処理が追いつかない場合は古い音声を捨てて最新の音声を優先する
+        if self.queue.maxlen is not None and len(self.queue) >= self.queue.maxlen:
+            message_posted.send(
+                self,
+                event=MessagePostedEvent(
+                    message="Transcription backlog full: dropped oldest queued audio",
+                    level=MessageLevel.WARNING,
+                ),
+            )
+
+        self.queue.append((audio, start_time, end_time))
+        self._audio_available.set()
 
     def run(self) -> None:
         """文字起こしループ"""
-        while self.running or not self.queue.empty():
+        while self.running or self.queue:
+            # 取り出す前に処理中フラグを立てる（取り出し直後に is_transcribing が
+            # キュー空・未処理中の両方を観測して完了と誤判定しないように）
+            self._processing = True
             try:
-                data = self.queue.get(timeout=0.5)
-            except queue.Empty:
+                # データを展開（キューの要素タプルはローカルに残さない）
+                audio, recording_start, recording_end = self.queue.popleft()
+            except IndexError:
+                # キューが空なら追加・停止の通知を待つ（add_audio と stop が必ず通知する）
+                # 通知は取り出しに失敗した後に待つため、待機前の追加も取りこぼさない
+                self._processing = False
+                self._notify_progress()
+                self._audio_available.wait()
+                self._audio_available.clear()
                 continue
 
-            # データを展開
-            audio, recording_start, recording_end = data
-
             # リトライ戦略を使用した文字起こし処理
-            self._processing = True
             try:
                 self._process_audio(audio, recording_start, recording_end)
             finally:
                 self._processing = False
+                self._notify_progress()
+                # 次の音声を待つ間、処理済みの音声バッファを保持しない
+                del audio
+
+        # 停止時に待機中のスレッドを起こす
+        self._notify_progress()
+
+    def _notify_progress(self) -> None:
+        """処理状況の変化を wait_for_progress の待機側に通知"""
+        with self._progress:
+            self._progress.notify_all()
+
+    def wait_for_progress(self, timeout: float | None) -> bool:
+        """
+        1件の処理完了（またはタイムアウト）まで待機
+
+        状態の確認と待機を同じロック内で行うため、通知の取りこぼしはない。
+
+        Args:
+            timeout: 最大待機時間（秒）、Noneなら通知まで待つ
+
+        Returns:
+            bool: 待機後もまだ文字起こし中の場合True
+        """
+        with self._progress:
+            if self.is_transcribing:
+                self._progress.wait(timeout)
+            return self.is_transcribing
 
     def _process_audio(
         self, audio: np.ndarray, recording_start: datetime, recording_end: datetime
@@ -124,8 +188,13 @@ class Transcriber(threading.Thread):
             recording_start: 録音開始時刻
             recording_end: 録音終了時刻
         """
-        strategy = TranscriptionRetryStrategy(self.whisper_settings)
-        processing_start = time.time()
+        # ほぼ無音の音声はWhisperを呼ばずに破棄（文字起こししても空テキストで破棄される）
+        if self._is_silent(audio):
+            return
+
+        strategy = self._strategy
+        strategy.reset()
+        processing_start = time.monotonic()
 
         while True:
             params = strategy.get_current_params()
@@ -147,7 +216,10 @@ class Transcriber(threading.Thread):
 
             # テキスト抽出と正規化
             text_raw = result.get("text", "")
-            text = str(text_raw).strip() if text_raw else ""
+            if isinstance(text_raw, str):
+                text = text_raw.strip()
+            else:
+                text = str(text_raw).strip() if text_raw else ""
             segments_raw = result.get("segments")
             segments = segments_raw if isinstance(segments_raw, list) else []
 
@@ -164,11 +236,13 @@ class Transcriber(threading.Thread):
             )
 
             # 戦略に評価を委譲
+            # 評価前の試行番号（リトライ時は段階を飛ばすことがあるため先に取得）
+            attempt, max_attempts = strategy.get_attempt_info()
             strategy_result = strategy.evaluate_result(text, filter_reason)
 
             if strategy_result.action == TranscriptionAction.ACCEPT:
                 # 成功：処理時間を計算してセグメントを作成
-                processing_time = time.time() - processing_start
+                processing_time = time.monotonic() - processing_start
 
                 segment = TranscriptionSegment(
                     text=text,
@@ -186,9 +260,8 @@ class Transcriber(threading.Thread):
 
             elif strategy_result.action == TranscriptionAction.RETRY:
                 # リトライ：エラーを通知して続行
-                attempt, max_attempts = strategy.get_attempt_info()
                 error_event = MessagePostedEvent(
-                    message=f"Quality issue detected (attempt {attempt - 1}/{max_attempts}): "
+                    message=f"Quality issue detected (attempt {attempt}/{max_attempts}): "
                     f"{strategy_result.reason} | Retrying with stricter parameters...",
                     level=MessageLevel.ERROR,
                     timestamp=recording_start,
@@ -199,7 +272,6 @@ class Transcriber(threading.Thread):
             else:  # TranscriptionAction.DISCARD
                 # 破棄：無音以外の場合はエラーを通知
                 if filter_reason:  # 無音ではない場合のみエラー表示
-                    attempt, max_attempts = strategy.get_attempt_info()
                     error_event = MessagePostedEvent(
                         message=f"Quality issue filtered (attempt {attempt}/{max_attempts}): "
                         f"{strategy_result.reason} | Text: '{text[:50]}...'",
@@ -209,15 +281,33 @@ class Transcriber(threading.Thread):
                     message_posted.send(self, event=error_event)
                 return
 
+    def _is_silent(self, audio: np.ndarray) -> bool:
+        """
+        音声のピーク振幅が無音判定閾値未満かどうか
+
+        Args:
+            audio: 音声データ
+
+        Returns:
+            bool: 無音とみなせる場合True
+        """
+        if audio.size == 0:
+            return True
+        # np.abs の一時配列を作らず、最大値と最小値からピーク振幅を求める
+        peak = max(float(audio.max()), -float(audio.min()))
+        return peak < self.whisper_settings.silence_peak_threshold
+
     @property
     def is_transcribing(self) -> bool:
         """
         文字起こし中かどうか（キュー待ち + 処理中）
 
+        ロックを取らず、フラグと deque の長さを読むだけ（UIからの高頻度ポーリング向け）
+
         Returns:
             bool: キューにタスクがあるか、処理中の場合True
         """
-        return self._processing or self.queue.qsize() > 0
+        return self._processing or bool(self.queue)
 
     def stop(self, wait_for_queue: bool = False) -> None:
         """
@@ -231,8 +321,7 @@ class Transcriber(threading.Thread):
 
         if not wait_for_queue:
             # キューをクリアして残タスクを破棄
-            try:
-                while True:
-                    self.queue.get_nowait()
-            except queue.Empty:
-                pass
+            self.queue.clear()
+
+        # 待機中のワーカーを即座に起こす
+        self._audio_available.set()
@@ -4,8 +4,10 @@ Stream Scribe - Transcription Retry Strategy Module
 文字起こしのリトライ戦略を管理するモジュール
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum, auto
+from types import MappingProxyType
 from typing import Any
 
 from stream_scribe.domain import WhisperSettings
@@ -31,7 +33,7 @@ class StrategyResult:
     """
 
     action: TranscriptionAction
-    next_params: dict[str, Any] | None = None
+    next_params: Mapping[str, Any] | None = None
     reason: str | None = None
 
 
@@ -46,14 +48,18 @@ class TranscriptionRetryStrategy:
     def __init__(self, settings: WhisperSettings) -> None:
         self.settings = settings
         self.current_attempt = 0
+        # 各段階のパラメータを一度だけ dict 化し、読み取り専用ビューで共有
+        self._params: tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType(params.model_dump()) for params in settings.params
+        )
 
     def reset(self) -> None:
         """状態をリセット（新しい音声処理の開始時に呼ぶ）"""
         self.current_attempt = 0
 
-    def get_current_params(self) -> dict[str, Any]:
-        """現在の試行に対応するWhisperパラメータを返す"""
-        return self.settings.params[self.current_attempt].model_dump()
+    def get_current_params(self) -> Mapping[str, Any]:
+        """現在の試行に対応するWhisperパラメータを返す（読み取り専用）"""
+        return self._params[self.current_attempt]
 
     def get_attempt_info(self) -> tuple[int, int]:
         """
@@ -88,7 +94,7 @@ class TranscriptionRetryStrategy:
 
         # リトライ可能な場合
         if self.current_attempt < self.settings.max_transcription_retries - 1:
-            self.current_attempt += 1
+            self.current_attempt = self._next_attempt(text)
             return StrategyResult(
                 action=TranscriptionAction.RETRY,
                 next_params=self.get_current_params(),
@@ -100,3 +106,29 @@ class TranscriptionRetryStrategy:
             action=TranscriptionAction.DISCARD,
             reason=f"Max retries reached. Last error: {filter_reason}",
         )
+
+    def _next_attempt(self, text: str) -> int:
+        """
+        次の試行番号を決定
+
+        初期プロンプトがそのまま出力された（プロンプト漏れ）場合、
+        同じプロンプトを使う段階では再発しやすいため、プロンプトが変わる段階まで進める
+        （最終段階は超えない）。それ以外は次の段階へ1つ進める。
+
+        Args:
+            text: 文字起こし結果のテキスト
+
+        Returns:
+            int: 次の試行番号（0-based）
+        """
+        params = self.settings.params
+        next_attempt = self.current_attempt + 1
+        prompt = params[self.current_attempt].initial_prompt
+        if prompt and prompt in text:
+            last_attempt = self.settings.max_transcription_retries - 1
+            while (
+                next_attempt < last_attempt
+                and params[next_attempt].initial_prompt == prompt
+            ):
+                next_attempt += 1
+        return next_attempt
@@ -5,8 +5,10 @@ Stream Scribe - JSON Exporter
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from stream_scribe.domain import TranscriptionSession
 
@@ -87,7 +89,29 @@ class SessionJsonExporter:
                 "content": session.final_summary.content,
             }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        # 一時ファイルに書き切ってから置き換える（書き込み途中で中断しても
+        # 既存ファイルや壊れたJSONが残らない）
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(SessionJsonExporter._encode(output_data))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return output_path
+
+    @staticmethod
+    def _encode(data: dict[str, Any]) -> bytes:
+        """
+        出力データを整形済みのUTF-8 JSONにエンコード
+
+        Args:
+            data: 出力データ
+
+        Returns:
+            bytes: インデント2のJSON（非ASCII文字はエスケープしない）
+        """
+        # 一括でエンコードしてから書き込む（json.dump は断片ごとに write する）
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
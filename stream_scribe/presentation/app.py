@@ -4,7 +4,9 @@ Stream Scribe - Core Application
 プレゼンテーション層：StreamScribeAppコアロジック（CLI/Web共通）
 """
 
+import threading
 import time
+from typing import TYPE_CHECKING
 
 from stream_scribe.domain import (
     AudioRecordedEvent,
@@ -20,14 +22,12 @@ from stream_scribe.domain import (
     segment_transcribed,
     summary_generated,
 )
-from stream_scribe.infrastructure.ai import LLMClient, RealtimeSummarizer
-from stream_scribe.infrastructure.audio import (
-    AudioSource,
-    AudioStream,
-    VADDetector,
-)
-from stream_scribe.infrastructure.ml import HallucinationFilter, Transcriber
-from stream_scribe.infrastructure.persistence import SessionJsonExporter
+
+# 重いインフラ層（ONNX Runtime、MLX Whisper、LLM SDK等）は使用時に読み込む
+# （--list-devices 等、アプリを起動しない経路の起動時間を短縮するため）
+if TYPE_CHECKING:
+    from stream_scribe.infrastructure.ai import LLMClient
+    from stream_scribe.infrastructure.audio import AudioSource
 
 
 class StreamScribeApp:
@@ -47,8 +47,8 @@ class StreamScribeApp:
 
     def __init__(
         self,
-        llm_client: LLMClient | None,
-        audio_source: AudioSource,
+        llm_client: "LLMClient | None",
+        audio_source: "AudioSource",
         settings: Settings,
     ):
         """
@@ -59,6 +59,10 @@ class StreamScribeApp:
             audio_source: 音声入力ソース
             settings: アプリケーション設定
         """
+        from stream_scribe.infrastructure.ai import RealtimeSummarizer
+        from stream_scribe.infrastructure.audio import AudioStream, VADDetector
+        from stream_scribe.infrastructure.ml import HallucinationFilter, Transcriber
+
         self.settings = settings
         self.is_file_mode = not audio_source.is_realtime
 
@@ -85,6 +89,12 @@ class StreamScribeApp:
             hallucination_filter=hallucination_filter,
             core_settings=settings.core,
             whisper_settings=settings.whisper,
+            # ファイル入力は全音声を文字起こしするため待ち音声を破棄しない
+            max_queued_chunks=(
+                None
+                if self.is_file_mode or settings.whisper.max_queued_chunks <= 0
+                else settings.whisper.max_queued_chunks
+            ),
         )
 
         # 6. AudioStream初期化
@@ -253,8 +263,9 @@ class StreamScribeApp:
                     ),
                 )
                 last_remaining = -1
-                while self.transcriber.is_transcribing:
-                    remaining = self.transcriber.queue.qsize()
+                is_transcribing: bool = True
+                while is_transcribing:
+                    remaining = len(self.transcriber.queue)
                     if remaining > 0 and remaining != last_remaining:
                         message_posted.send(
                             None,
@@ -264,9 +275,9 @@ class StreamScribeApp:
                             ),
                         )
                         last_remaining = remaining
-                    time.sleep(
-                        self.settings.app.transcription_progress_poll_interval_sec
-                    )
+                    # 1件の処理完了の通知まで眠る（録音停止後はキューが増えないため、
+                    # 起床は必ず残り件数の変化か完了に対応する）
+                    is_transcribing = self.transcriber.wait_for_progress(timeout=None)
 
             self.transcriber.stop(wait_for_queue=True)
             self.transcriber.join(timeout=self.settings.whisper.shutdown_timeout_sec)
@@ -293,12 +304,19 @@ class StreamScribeApp:
                 self.summarizer.stop(session=self.session)
                 self.summarizer.join(timeout=self.settings.summary.shutdown_timeout_sec)
         else:
+            # 両ワーカーに停止を通知してから、共通の期限内で並行に終了を待つ
+            # （待ち時間の上限は各タイムアウトの合計ではなく1回分）
             self.transcriber.stop(wait_for_queue=False)
             if self.summarizer:
                 # サマリ生成せずに即座に終了
                 self.summarizer.stop(session=None)
-                self.summarizer.join(timeout=1.0)
-            self.transcriber.join(timeout=1.0)
+
+            deadline = time.monotonic() + 1.0
+            workers: list[threading.Thread] = [self.transcriber]
+            if self.summarizer:
+                workers.append(self.summarizer)
+            for worker in workers:
+                worker.join(timeout=max(0.0, deadline - time.monotonic()))
 
     def _save_session(self) -> None:
         """
@@ -307,6 +325,8 @@ class StreamScribeApp:
         if not self.settings.app.save_json or self.session.get_total_segments() == 0:
             return
 
+        from stream_scribe.infrastructure.persistence import SessionJsonExporter
+
         output_path = SessionJsonExporter.save_to_file(self.session)
         message_posted.send(
             None,
@@ -4,15 +4,36 @@ Stream Scribe - CLI Presentation
 CLIプレゼンテーション層
 """
 
-# CLIコントローラー
-from .controller import CLIController
-
-# CLIビュー
-from .view import CLIView
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # CLIエントリーポイント
 from .main import main
 
+if TYPE_CHECKING:
+    from .controller import CLIController
+    from .view import CLIView
+
+# コントローラー・ビューはアプリ本体の重い依存を読み込むため、初回参照時に読み込む
+# （python -m stream_scribe --help / --list-devices の起動時間を短縮するため）
+_LAZY_EXPORTS = {
+    # コントローラー
+    "CLIController": ".controller",
+    # ビュー
+    "CLIView": ".view",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """遅延読み込み対象の公開名を解決する（PEP 562）"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # コントローラー
     "CLIController",
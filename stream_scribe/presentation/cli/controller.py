@@ -4,11 +4,11 @@ Stream Scribe - CLI Controller
 CLIアプリケーションのコントローラー層：アプリケーションのライフサイクル管理
 """
 
-import select
+import os
+import selectors
 import sys
-import time
+import threading
 import traceback
-from collections.abc import Callable
 
 from stream_scribe.domain import (
     MessageLevel,
@@ -53,6 +53,11 @@ class CLIController:
         self.app: StreamScribeApp | None = None
         self.view: CLIView | None = None
 
+        # 終了待機を起こすパイプの書き込み側（待機中のみ有効、ファイル処理完了時に書き込む）
+        # 待機終了後に完了監視スレッドが書き込まないよう、ロックで閉鎖と排他する
+        self._wake_w: int | None = None
+        self._wake_lock = threading.Lock()
+
     def run(self) -> None:
         """
         アプリケーションを実行
@@ -106,16 +111,8 @@ class CLIController:
         is_file_mode = not audio_source.is_realtime
 
         try:
-            # 終了シグナルを待機
-            stop_condition = (
-                (
-                    lambda: not app.audio_stream.is_alive()
-                    and not app.transcriber.is_transcribing
-                )
-                if is_file_mode
-                else None
-            )
-            completed = self._wait_for_exit_signal(stop_condition)
+            # 終了シグナルを待機（ファイル入力では処理完了でも終了）
+            completed = self._wait_for_exit_signal(app if is_file_mode else None)
 
             if completed:
                 # ファイル処理完了
@@ -180,39 +177,72 @@ class CLIController:
                 device_id=self.device_id,
             )
 
-    def _wait_for_exit_signal(
-        self, stop_condition: Callable[[], bool] | None = None
-    ) -> bool:
+    def _watch_file_completion(self, app: StreamScribeApp) -> None:
+        """
+        ファイル処理の完了（音声読み込み終了 + 文字起こし完了）を待って終了待機を起こす
+
+        Args:
+            app: 監視対象のアプリケーション
+        """
+        # 音声読み込みが終わると、以降キューに音声が追加されることはない
+        app.audio_stream.join()
+        while app.transcriber.wait_for_progress(timeout=None):
+            pass
+
+        # 待機がすでに終了（パイプを閉鎖済み）なら何もしない
+        with self._wake_lock:
+            if self._wake_w is not None:
+                os.write(self._wake_w, b"\0")
+
+    def _wait_for_exit_signal(self, watched_app: StreamScribeApp | None = None) -> bool:
         """
         終了シグナルを待機
 
+        標準入力（Ctrl-D検出用）と終了待機用パイプをセレクタに登録し、
+        どちらかが読み込み可能になるまでブロックする（ポーリングしない）。
+        パイプは待機の間だけ開き、終了時に閉じる。
+
         Args:
-            stop_condition: 終了条件を判定する関数。Trueを返すとループ終了。
+            watched_app: 処理完了を監視するアプリケーション（ファイル入力時のみ）
 
         Returns:
-            bool: stop_conditionがTrueで終了した場合True、それ以外False
+            bool: ファイル処理完了で終了した場合True
 
         Raises:
             KeyboardInterrupt: Ctrl-C が押された場合
             EOFError: Ctrl-D が押された場合
         """
-        while stop_condition is None or not stop_condition():
-            # 標準入力の監視（Ctrl-D検出用）
-            if sys.stdin.isatty():
-                ready, _, _ = select.select(
-                    [sys.stdin], [], [], self.settings.app.input_poll_interval_sec
-                )
-                if ready:
-                    try:
-                        if not sys.stdin.read(1):
+        wake_r, wake_w = os.pipe()
+        self._wake_w = wake_w
+        try:
+            # パイプ作成後に監視を始める（完了通知を取りこぼさない）
+            if watched_app is not None:
+                threading.Thread(
+                    target=self._watch_file_completion,
+                    args=(watched_app,),
+                    daemon=True,
+                    name="FileCompletionWatcher",
+                ).start()
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(wake_r, selectors.EVENT_READ)
+                if sys.stdin.isatty():
+                    selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+
+                while True:
+                    for key, _ in selector.select():
+                        if key.fd == wake_r:
+                            return True
+                        # 入力済みの分をまとめて読み捨てる（テキスト層のバッファを介さないため、
+                        # 未読データが残ったまま select が待機し続けることもない）
+                        if not os.read(key.fd, 4096):
                             # EOF (Ctrl-D)
                             raise EOFError
-                    except EOFError:
-                        raise
-            else:
-                time.sleep(self.settings.app.input_poll_interval_sec)
-
-        return True
+        finally:
+            with self._wake_lock:
+                self._wake_w = None
+            os.close(wake_w)
+            os.close(wake_r)
 
     def _shutdown(self, graceful: bool) -> None:
         """
@@ -5,14 +5,11 @@ CLIアプリケーションのエントリーポイント
 """
 
 import argparse
+import sys
 
 from colorama import Fore, Style  # type: ignore[import-untyped]
 from colorama import init as colorama_init
 
-from stream_scribe.infrastructure.audio import MicrophoneAudioSource
-
-from .controller import CLIController
-
 
 def parse_args() -> argparse.Namespace:
     """CLI引数を解析する"""
@@ -47,15 +44,21 @@ def parse_args() -> argparse.Namespace:
 
 def print_audio_devices() -> None:
     """利用可能なオーディオ入力デバイス一覧を表示する"""
+    # 音声ソースのみ読み込む（アプリ本体の重い依存は読み込まない）
+    from stream_scribe.infrastructure.audio.sources import MicrophoneAudioSource
+
     devices = MicrophoneAudioSource.list_devices()
 
-    print(f"\n{Fore.CYAN}Available audio input devices:{Style.RESET_ALL}\n")
+    # 一覧全体を組み立ててから1回で書き込む
+    lines = [f"\n{Fore.CYAN}Available audio input devices:{Style.RESET_ALL}\n"]
     for device in devices:
         default_marker = (
             f" {Fore.GREEN}(default){Style.RESET_ALL}" if device.is_default else ""
         )
-        print(f"  [{device.id}] {device.name}{default_marker}")
-    print()
+        lines.append(f"  [{device.id}] {device.name}{default_marker}")
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def main() -> None:
@@ -63,15 +66,20 @@ def main() -> None:
     # CLI引数解析
     args = parse_args()
 
-    # colorama初期化
-    colorama_init(autoreset=True)
+    # colorama初期化（ANSIエスケープを変換する必要があるWindowsのみ）
+    # 他の環境では端末がANSIをそのまま解釈し、表示側は色付けの末尾で必ず
+    # Style.RESET_ALL を出力するため、stdoutを書き込みごとに走査するラッパーは不要
+    if sys.platform == "win32":
+        colorama_init(autoreset=True)
 
     # デバイス一覧表示モード
     if args.list_devices:
         print_audio_devices()
         return
 
-    # CLIController起動
+    # CLIController起動（アプリ本体はここで初めて読み込む）
+    from .controller import CLIController
+
     controller = CLIController(
         device_id=args.device,
         file_path=args.file,
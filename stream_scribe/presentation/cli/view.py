@@ -9,6 +9,7 @@ import re
 import sys
 import threading
 import time
+from typing import ClassVar
 
 import wcwidth  # type: ignore[import-untyped]
 from colorama import Fore, Style  # type: ignore[import-untyped]
@@ -26,7 +27,7 @@ from stream_scribe.domain import (
     summary_generated,
 )
 from stream_scribe.infrastructure.ai import LLMClient, RealtimeSummarizer
-from stream_scribe.infrastructure.audio import AudioStream
+from stream_scribe.infrastructure.audio import AudioStream, AudioStreamStatus
 from stream_scribe.infrastructure.ml import Transcriber
 
 
@@ -44,6 +45,14 @@ class CLIView:
     # ANSIエスケープコード削除用パターン（コンパイル済み）
     _ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 
+    # メッセージレベルごとの表示色
+    _LEVEL_COLORS: ClassVar[dict[MessageLevel, str]] = {
+        MessageLevel.INFO: Fore.CYAN,
+        MessageLevel.SUCCESS: Fore.GREEN,
+        MessageLevel.WARNING: Fore.YELLOW,
+        MessageLevel.ERROR: Fore.RED,
+    }
+
     def __init__(self, settings: Settings) -> None:
         """
         CLIViewの初期化とSignalサブスクリプション設定
@@ -62,6 +71,10 @@ class CLIView:
         self._transcriber: Transcriber | None = None
         self._summarizer: RealtimeSummarizer | None = None
 
+        # 最後に描画したステータスバーの内容（同じ内容の再描画を省略する）
+        # ステータスバーを消す書き込みの後は None に戻して必ず再描画させる
+        self._last_status_key: tuple[int, str, str, str] | None = None
+
         # Signalサブスクリプション設定
         segment_transcribed.connect(self._on_segment_transcribed)
         summary_generated.connect(self._on_summary_generated)
@@ -127,6 +140,7 @@ class CLIView:
 
         # 表示をクリア
         with self.lock:
+            self._last_status_key = None
             sys.stdout.write("\r\033[K\n")
             sys.stdout.flush()
 
@@ -134,41 +148,46 @@ class CLIView:
 
     def _status_update_loop(self) -> None:
         """ステータス更新ループ（別スレッドで実行）"""
+        # 参照先はループ中に変わらないため、属性の解決はループ前に1回だけ行う
+        audio_stream = self._audio_stream
+        transcriber = self._transcriber
+        summarizer = self._summarizer
+        if audio_stream is None or transcriber is None:
+            return
+
+        get_status = audio_stream.get_status
+        update_status_bar = self._update_status_bar
+        summary_threshold = summarizer.settings.trigger_threshold if summarizer else 0
+        interval = self.settings.app.status_update_interval_sec
+        monotonic = time.monotonic
+
+        # 描画時間を含めて一定間隔になるよう、次回の更新時刻を基準に待機する
+        deadline = monotonic()
         while self._running:
-            if self._audio_stream and self._transcriber:
-                # AudioStreamから状態を取得
-                audio_status = self._audio_stream.get_status()
-
-                # ステータスバーを更新
-                self._update_status_bar(
-                    probability=audio_status.probability,
-                    is_recording=audio_status.is_recording,
-                    is_transcribing=self._transcriber.is_transcribing,
-                    is_summarizing=self._summarizer.is_summarizing
-                    if self._summarizer
-                    else False,
-                    recording_elapsed=audio_status.recording_elapsed,
-                    speech_chunks=audio_status.speech_chunks,
-                    summary_buffer_count=self._summarizer.buffer_char_count
-                    if self._summarizer
-                    else 0,
-                    summary_threshold=self._summarizer.settings.trigger_threshold
-                    if self._summarizer
-                    else 0,
-                )
+            # AudioStreamの状態はオブジェクトのまま渡す（フィールドごとに展開しない）
+            update_status_bar(
+                get_status(),
+                is_transcribing=transcriber.is_transcribing,
+                is_summarizing=summarizer.is_summarizing if summarizer else False,
+                summary_buffer_count=summarizer.buffer_char_count if summarizer else 0,
+                summary_threshold=summary_threshold,
+            )
 
-            time.sleep(self.settings.app.status_update_interval_sec)
+            deadline += interval
+            remaining = deadline - monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif remaining < -interval:
+                # 1間隔以上遅れた場合は追いつくための連続更新をせず、基準を現在に戻す
+                deadline = monotonic()
 
     # ========== 表示メソッド ==========
 
     def _update_status_bar(
         self,
-        probability: float,
-        is_recording: bool,
+        audio_status: AudioStreamStatus,
         is_transcribing: bool,
         is_summarizing: bool,
-        recording_elapsed: float,
-        speech_chunks: int,
         summary_buffer_count: int,
         summary_threshold: int,
     ) -> None:
@@ -179,6 +198,8 @@ class CLIView:
 
         try:
             terminal_width = os.get_terminal_size().columns
+            probability = audio_status.probability
+            speech_chunks = audio_status.speech_chunks
 
             # VADセクション構築
             bar_width = 20
@@ -195,9 +216,9 @@ class CLIView:
 
             # ステータステキスト構築
             status_parts = []
-            if is_recording:
+            if audio_status.is_recording:
                 status_parts.append(
-                    f"{Fore.RED}● REC [{recording_elapsed:.1f}s]{Style.RESET_ALL}"
+                    f"{Fore.RED}● REC [{audio_status.recording_elapsed:.1f}s]{Style.RESET_ALL}"
                 )
             elif speech_chunks > 0:
                 speech_duration = speech_chunks * self.settings.core.chunk_ms / 1000.0
@@ -223,6 +244,12 @@ class CLIView:
                 f"{Fore.YELLOW}Buffer: {summary_progress}{Style.RESET_ALL}"
             )
 
+            # 表示内容が前回と同じなら、幅計算と書き込みを省略
+            status_key = (terminal_width, vad_section, status_text, right_section)
+            if status_key == self._last_status_key:
+                return
+            self._last_status_key = status_key
+
             # 左側セクション構築（オーバーフロー対応）
             full_left = f"{vad_section} | {status_text}"
             left_width = self._get_display_width(full_left)
@@ -260,41 +287,32 @@ class CLIView:
         time_info = f"{Fore.MAGENTA}(audio: {segment.audio_duration:.2f}s, proc: {segment.processing_time:.2f}s){Style.RESET_ALL}"
 
         with self.lock:
-            # 現在のステータスバーをクリア
-            sys.stdout.write("\r\033[K")
+            self._last_status_key = None
+            # 現在のステータスバーをクリアして1回の書き込みで表示
             sys.stdout.write(
-                f"{Fore.GREEN}[{timestamp}]{Style.RESET_ALL} {segment.text} {time_info}\n"
+                f"\r\033[K{Fore.GREEN}[{timestamp}]{Style.RESET_ALL} {segment.text} {time_info}\n"
             )
             sys.stdout.flush()
 
     def _show_message(self, event: MessagePostedEvent) -> None:
         """メッセージを表示"""
         # メッセージレベルに応じた色を選択
-        color_map = {
-            MessageLevel.INFO: Fore.CYAN,
-            MessageLevel.SUCCESS: Fore.GREEN,
-            MessageLevel.WARNING: Fore.YELLOW,
-            MessageLevel.ERROR: Fore.RED,
-        }
-        color = color_map.get(event.level, Fore.WHITE)
+        color = self._LEVEL_COLORS.get(event.level, Fore.WHITE)
 
         with self.lock:
-            # 現在のステータスバーをクリア
-            sys.stdout.write("\r\033[K")
-            sys.stdout.write(f"{color}{event.message}{Style.RESET_ALL}\n")
+            self._last_status_key = None
+            # 現在のステータスバーをクリアして1回の書き込みで表示
+            sys.stdout.write(f"\r\033[K{color}{event.message}{Style.RESET_ALL}\n")
             sys.stdout.flush()
 
     def _show_summary(self, summary_text: str) -> None:
         """リアルタイム議事録をダッシュボード形式で表示"""
-        with self.lock:
-            # 現在のステータスバーをクリア
-            sys.stdout.write("\r\033[K")
-
-            # 要約ヘッダーと内容を表示
-            print(f"\n{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}")
-            print(summary_text)
-            print(f"{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}\n")
+        separator = f"{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}"
 
+        with self.lock:
+            self._last_status_key = None
+            # 現在のステータスバーをクリアし、要約ヘッダーと内容を1回の書き込みで表示
+            sys.stdout.write(f"\r\033[K\n{separator}\n{summary_text}\n{separator}\n\n")
             sys.stdout.flush()
 
     def show_banner(self, llm_client: LLMClient | None) -> None:
@@ -0,0 +1,160 @@
+"""音声ソースのテスト"""
+
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from scipy.signal import resample_poly  # type: ignore[import-untyped]
+
+# sounddevice が利用できない環境（Linux CI等）ではモックする
+if "sounddevice" not in sys.modules:
+    sys.modules["sounddevice"] = MagicMock()
+
+from stream_scribe.domain import CoreSettings
+from stream_scribe.infrastructure.audio import sources
+from stream_scribe.infrastructure.audio.sources import (
+    AudioDevice,
+    FileAudioSource,
+    MicrophoneAudioSource,
+    _StreamingResampler,
+)
+
+
+@pytest.fixture
+def core_settings() -> CoreSettings:
+    """デフォルトのCoreSettings"""
+    return CoreSettings()
+
+
+def _write_wav(path: Path, sample_rate: int, frames: int, channels: int) -> np.ndarray:
+    """ランダムな音声を書き出し、そのモノラル波形を返す"""
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal((frames, channels)) * 0.1).astype(np.float32)
+    sf.write(path, audio, sample_rate, subtype="FLOAT")
+    return np.mean(audio, axis=1)
+
+
+class TestStreamingResampler:
+    """ブロック単位リサンプリングのテスト"""
+
+    @pytest.mark.parametrize(
+        ("original_sr", "block_size"),
+        [(44100, 8192), (48000, 1000), (22050, 777), (8000, 512)],
+    )
+    def test_matches_resample_poly(self, original_sr: int, block_size: int) -> None:
+        """ブロック分割しても一括処理と同じ出力になる"""
+        rng = np.random.default_rng(1)
+        audio = rng.standard_normal(original_sr * 2 + 123).astype(np.float32)
+
+        resampler = _StreamingResampler(original_sr, 16000)
+        blocks = [
+            resampler.process(audio[i : i + block_size])
+            for i in range(0, len(audio), block_size)
+        ]
+        blocks.append(resampler.flush())
+        streamed = np.concatenate(blocks)
+
+        expected = resample_poly(audio, 16000, original_sr)
+        assert streamed.dtype == np.float32
+        assert len(streamed) == len(expected)
+        np.testing.assert_allclose(streamed, expected, atol=1e-5)
+
+
+class TestFileAudioSource:
+    """ファイル入力ソースのテスト"""
+
+    def test_yields_fixed_size_chunks(
+        self, tmp_path: Path, core_settings: CoreSettings
+    ) -> None:
+        """全チャンクがchunk_sizeのfloat32で、末尾はゼロパディングされる"""
+        path = tmp_path / "stereo.wav"
+        mono = _write_wav(path, 44100, 44100 * 3 + 17, channels=2)
+
+        source = FileAudioSource(core_settings, str(path))
+        source.start()
+        chunks = list(source.stream())
+        source.stop()
+
+        assert all(len(c) == core_settings.chunk_size for c in chunks)
+        assert all(c.dtype == np.float32 for c in chunks)
+
+        expected = resample_poly(mono, core_settings.sample_rate, 44100)
+        streamed = np.concatenate(chunks)
+        np.testing.assert_allclose(streamed[: len(expected)], expected, atol=1e-5)
+        assert not streamed[len(expected) :].any()
+
+    def test_duration(self, tmp_path: Path, core_settings: CoreSettings) -> None:
+        """duration はリサンプリング後の長さから算出される"""
+        path = tmp_path / "mono.wav"
+        _write_wav(path, 48000, 48000 * 2, channels=1)
+
+        source = FileAudioSource(core_settings, str(path))
+        source.start()
+
+        assert source.duration == pytest.approx(2.0)
+
+    def test_no_resampling_when_rates_match(
+        self, tmp_path: Path, core_settings: CoreSettings
+    ) -> None:
+        """サンプルレートが一致する場合はそのまま出力される"""
+        path = tmp_path / "native.wav"
+        mono = _write_wav(
+            path, core_settings.sample_rate, core_settings.chunk_size * 20, channels=1
+        )
+
+        source = FileAudioSource(core_settings, str(path))
+        source.start()
+        streamed = np.concatenate(list(source.stream()))
+
+        np.testing.assert_array_equal(streamed, mono)
+
+    def test_stream_is_empty_before_start(
+        self, tmp_path: Path, core_settings: CoreSettings
+    ) -> None:
+        """start() 前は何も yield しない"""
+        source = FileAudioSource(core_settings, str(tmp_path / "missing.wav"))
+        assert list(source.stream()) == []
+
+
+class TestListDevices:
+    """入力デバイス一覧のテスト"""
+
+    @pytest.fixture
+    def fake_sd(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[MagicMock, None, None]:
+        """PortAudioの代わりに固定のデバイス一覧を返す sounddevice モック"""
+        fake = MagicMock()
+        fake.DeviceList = list
+        fake.query_devices.return_value = [
+            {"name": "Speaker", "max_input_channels": 0},
+            {"name": "Mic", "max_input_channels": 1},
+            {"name": "Interface", "max_input_channels": 2},
+        ]
+        fake.default.device = (2, 0)
+        monkeypatch.setattr(sources, "sd", fake)
+
+        MicrophoneAudioSource.refresh_devices()
+        yield fake
+        MicrophoneAudioSource.refresh_devices()
+
+    def test_lists_input_devices_only(self, fake_sd: MagicMock) -> None:
+        """入力チャンネルを持つデバイスのみ返す"""
+        assert MicrophoneAudioSource.list_devices() == (
+            AudioDevice(id=1, name="Mic", max_input_channels=1),
+            AudioDevice(id=2, name="Interface", max_input_channels=2, is_default=True),
+        )
+
+    def test_query_is_cached_until_refresh(self, fake_sd: MagicMock) -> None:
+        """refresh_devices() まではPortAudioに再問い合わせしない"""
+        MicrophoneAudioSource.list_devices()
+        MicrophoneAudioSource.list_devices()
+        assert fake_sd.query_devices.call_count == 1
+
+        MicrophoneAudioSource.refresh_devices()
+        MicrophoneAudioSource.list_devices()
+        assert fake_sd.query_devices.call_count == 2
@@ -53,6 +53,15 @@ class TestBannedPhrases:
         result = filter_instance.evaluate_transcription("これは普通の文章です")
         assert result is None
 
+    def test_reports_first_phrase_in_list_order(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """複数の禁止フレーズを含む場合、リスト順で最初のフレーズを報告する"""
+        result = filter_instance.evaluate_transcription(
+            "高評価とチャンネル登録をお願いします"
+        )
+        assert result == "Banned phrase: 'チャンネル登録'"
+
 
 class TestCharacterRepetition:
     """文字繰り返し検出のテスト"""
@@ -85,6 +94,22 @@ class TestCharacterRepetition:
         result = filter_instance.evaluate_transcription("あいうえおかきくけこ")
         assert result is None
 
+    def test_long_text_reports_first_run(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """長いテキストでも最初に現れた連続文字を報告する"""
+        text = "あいうえお" * 80 + "ん" * 10 + "あいうえお" + "ー" * 30
+        result = filter_instance._check_character_repetition(text)
+        assert result is not None
+        assert "'ん'" in result
+
+    def test_long_varied_text_passes(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """長い多様なテキストは通過する"""
+        text = "あいうえおかきくけこ" * 50
+        assert filter_instance._check_character_repetition(text) is None
+
 
 class TestShortPatternRepetition:
     """短パターン繰り返し検出のテスト"""
@@ -114,6 +139,20 @@ class TestShortPatternRepetition:
         result = filter_instance.evaluate_transcription("ピリピリ")
         assert result is None
 
+    def test_detects_repetition_among_varied_characters(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """繰り返し以外の部分の文字種が多くても、割合を満たせば検出する"""
+        text = "ピリ" * 10 + "今日は会議で進捗について話し合いました。"
+        result = filter_instance._check_short_pattern_repetition(text)
+        assert result is not None
+        assert "'ピリ" in result
+
+    def test_passes_varied_sentence(self, filter_instance: HallucinationFilter) -> None:
+        """文字種の多い自然文は通過する"""
+        text = "今日は会議でプロジェクトの進捗について話し合いました。"
+        assert filter_instance._check_short_pattern_repetition(text) is None
+
 
 class TestLongPatternRepetition:
     """長パターン繰り返し検出のテスト"""
@@ -127,6 +166,16 @@ class TestLongPatternRepetition:
         assert result is not None
         assert "Long phrase repetition" in result
 
+    def test_detects_non_adjacent_long_phrase_repetition(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """間に別の文字列を挟んだ長いフレーズの繰り返しも検出する"""
+        phrase = "私たちの意味が好きな話題について"
+        text = "".join(f"{phrase}{filler}" for filler in "あいうえ")
+        result = filter_instance._check_long_pattern_repetition(text)
+        assert result is not None
+        assert "Long phrase repetition" in result
+
     def test_passes_non_repetitive_long_text(
         self, filter_instance: HallucinationFilter
     ) -> None:
@@ -269,6 +318,22 @@ class TestContextlessGreeting:
         assert result is not None
         assert "Contextless greeting" in result
 
+    def test_reevaluates_confidence_for_repeated_text(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """同じテキストでも信頼度が変われば判定が変わる（キャッシュは信頼度に依存しない）"""
+        assert (
+            filter_instance.evaluate_transcription(
+                "おやすみなさい", avg_logprob=-0.3, audio_duration=2.0
+            )
+            is None
+        )
+        result = filter_instance.evaluate_transcription(
+            "おやすみなさい", avg_logprob=-0.9, audio_duration=2.0
+        )
+        assert result is not None
+        assert "Contextless greeting" in result
+
 
 class TestExtractMetrics:
     """メトリクス抽出のテスト"""
@@ -319,3 +384,18 @@ class TestExtractMetrics:
         assert avg_logprob == -0.5
         assert compression_ratio == 1.5
         assert no_speech_prob is None
+
+    def test_ignores_non_numeric_metrics(
+        self, filter_instance: HallucinationFilter
+    ) -> None:
+        """数値でないメトリクスは無視する"""
+        segments = [
+            {"avg_logprob": "n/a", "compression_ratio": None, "no_speech_prob": 0.3},
+            {"avg_logprob": -0.4, "compression_ratio": 2.0, "no_speech_prob": "high"},
+        ]
+        avg_logprob, compression_ratio, no_speech_prob = (
+            filter_instance.extract_metrics(segments)
+        )
+        assert avg_logprob == -0.4
+        assert compression_ratio == 2.0
+        assert no_speech_prob == 0.3
@@ -0,0 +1,52 @@
+"""設定スキーマ（廃止キーの互換処理）のテスト"""
+
+import pytest
+
+from stream_scribe.domain import Settings
+from stream_scribe.domain.settings import AudioSettings
+
+
+class TestDeprecatedAudioBlockSec:
+    """audio.block_sec（廃止）の読み替えテスト"""
+
+    def test_block_sec_is_converted_to_block_chunks(self) -> None:
+        """block_sec は警告付きで block_chunks に換算される"""
+        with pytest.warns(FutureWarning, match="audio.block_sec"):
+            settings = Settings(audio={"block_sec": 0.064})
+
+        # 0.064秒 = 1024サンプル = 512サンプル × 2
+        assert settings.audio.block_chunks == 2
+
+    def test_block_chunks_takes_precedence(self) -> None:
+        """block_chunks が指定されていればそちらを優先する"""
+        with pytest.warns(FutureWarning):
+            settings = AudioSettings(block_sec=0.1, block_chunks=4)
+
+        assert settings.block_chunks == 4
+
+    def test_short_block_sec_is_at_least_one_chunk(self) -> None:
+        """チャンク長未満の block_sec でも1チャンク以上になる"""
+        with pytest.warns(FutureWarning):
+            settings = AudioSettings(block_sec=0.001)
+
+        assert settings.block_chunks == 1
+
+
+class TestRemovedAppPollIntervals:
+    """イベント駆動化で廃止したポーリング間隔設定のテスト"""
+
+    def test_input_poll_interval_is_ignored_with_warning(self) -> None:
+        """app.input_poll_interval_sec は警告付きで無視される"""
+        with pytest.warns(FutureWarning, match="app.input_poll_interval_sec"):
+            settings = Settings(app={"input_poll_interval_sec": 0.05})
+
+        assert not hasattr(settings.app, "input_poll_interval_sec")
+
+    def test_progress_poll_interval_is_ignored_with_warning(self) -> None:
+        """app.transcription_progress_poll_interval_sec は警告付きで無視される"""
+        with pytest.warns(
+            FutureWarning, match="app.transcription_progress_poll_interval_sec"
+        ):
+            settings = Settings(app={"transcription_progress_poll_interval_sec": 1.0})
+
+        assert not hasattr(settings.app, "transcription_progress_poll_interval_sec")
@@ -56,6 +56,15 @@ class TestInitialState:
         assert attempt == 1
         assert max_attempts == settings.max_transcription_retries
 
+    def test_params_are_shared_read_only_views(
+        self, strategy: TranscriptionRetryStrategy
+    ) -> None:
+        """パラメータは呼び出しごとに作り直さず、読み取り専用で共有する"""
+        params = strategy.get_current_params()
+        assert strategy.get_current_params() is params
+        with pytest.raises(TypeError):
+            params["temperature"] = 1.0  # type: ignore[index]
+
 
 class TestReset:
     """リセット機能のテスト"""
@@ -156,6 +165,36 @@ class TestRetryAction:
             assert result.action == TranscriptionAction.RETRY
             assert result.next_params == settings.params[i + 1].model_dump()
 
+    def test_prompt_leak_skips_phases_with_same_prompt(
+        self, strategy: TranscriptionRetryStrategy, settings: WhisperSettings
+    ) -> None:
+        """初期プロンプトが出力された場合は同じプロンプトの段階を飛ばす"""
+        prompt = settings.params[0].initial_prompt
+        assert prompt is not None
+        result = strategy.evaluate_result(prompt, f"Banned phrase: '{prompt}'")
+        assert result.action == TranscriptionAction.RETRY
+        next_params = settings.params[strategy.current_attempt]
+        assert next_params.initial_prompt != prompt
+        assert result.next_params == next_params.model_dump()
+        # 飛ばした段階はすべて同じプロンプトを使う段階
+        for skipped in settings.params[1 : strategy.current_attempt]:
+            assert skipped.initial_prompt == prompt
+
+    def test_prompt_leak_does_not_skip_past_last_phase(
+        self, settings: WhisperSettings
+    ) -> None:
+        """全段階が同じプロンプトでも最終段階を超えない"""
+        prompt = "テスト用プロンプト"
+        params = [
+            p.model_copy(update={"initial_prompt": prompt}) for p in settings.params
+        ]
+        strategy = TranscriptionRetryStrategy(
+            settings.model_copy(update={"params": params})
+        )
+        result = strategy.evaluate_result(prompt, "Banned phrase")
+        assert result.action == TranscriptionAction.RETRY
+        assert strategy.current_attempt == settings.max_transcription_retries - 1
+
 
 class TestDiscardAction:
     """DISCARD アクションのテスト"""
@@ -1,5 +1,6 @@
 """VadStateMachineのテスト"""
 
+import random
 import sys
 from unittest.mock import MagicMock
 
@@ -388,3 +389,51 @@ class TestEdgeCases:
 
         # 交互パターンでは録音開始しないはず
         assert state_machine.is_recording is False
+
+
+class TestProcessBatch:
+    """まとめて処理した場合の動作テスト"""
+
+    @staticmethod
+    def _snapshot(state_machine: VadStateMachine) -> tuple[bool, int, int, int]:
+        return (
+            state_machine.is_recording,
+            state_machine.speech_chunks,
+            state_machine.silence_chunks,
+            state_machine.idle_silence_chunks,
+        )
+
+    def test_matches_sequential_process(self) -> None:
+        """process() を順に呼んだ場合と同じアクション・状態になる"""
+        settings = VADDetectionSettings(max_silence_chunks=5, idle_reset_chunks=20)
+        rng = random.Random(0)
+        probabilities = [
+            rng.choice([0.1, 0.35, 0.6, 0.9]) if i % 100 < 25 else 0.0
+            for i in range(2000)
+        ]
+
+        sequential = VadStateMachine(settings)
+        expected = [sequential.process(p) for p in probabilities]
+
+        batched = VadStateMachine(settings)
+        actions: list[VadAction] = []
+        while len(actions) < len(probabilities):
+            actions += batched.process_batch(probabilities[len(actions) :])
+
+        assert actions == expected
+        assert self._snapshot(batched) == self._snapshot(sequential)
+        assert VadAction.STOP_RECORDING in actions
+        assert VadAction.RESET_VAD_MODEL in actions
+
+    def test_stops_at_vad_reset(self, settings: VADDetectionSettings) -> None:
+        """VADリセットを伴うアクションで打ち切る"""
+        state_machine = VadStateMachine(settings)
+        probabilities = [1.0] * settings.min_speech_chunks + [0.0] * (
+            settings.max_silence_chunks + 10
+        )
+
+        actions = state_machine.process_batch(probabilities)
+
+        assert len(actions) == settings.min_speech_chunks + settings.max_silence_chunks
+        assert actions[-1] == VadAction.STOP_RECORDING
+        assert actions.count(VadAction.START_RECORDING) == 1